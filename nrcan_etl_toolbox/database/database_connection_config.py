@@ -1,8 +1,62 @@
 import os
+import threading
 from dataclasses import dataclass, field
 
 import sqlalchemy
 
+# query_cache_size: the compiled-statement cache holds one entry per statement shape (model x filter set);
+# the default of 500 is too small for ETL jobs querying many models and gets evicted.
+_ENGINE_OPTIONS = {"future": True, "insertmanyvalues_page_size": 1000, "query_cache_size": 1200}
+
+# LIFO pool: reuse the most recently returned connection and let idle ones be recycled.
+_POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_timeout": 30,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+}
+
+# psycopg2 fast-path: coalesce executemany() parameter sets into multi-row statements.
+_PSYCOPG2_ENGINE_OPTIONS = {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500}
+
+
+def _build_engine(url: str | sqlalchemy.engine.URL, **overrides) -> sqlalchemy.engine.Engine:
+    """
+    Build a SQLAlchemy Engine with the toolbox default options.
+    Pool options are applied unless the backend is SQLite (own pool classes) or a poolclass is given.
+    psycopg2 batch options are only applied when the URL targets the psycopg2 driver.
+    overrides are passed to sqlalchemy.create_engine and take precedence over the defaults.
+    """
+    options = dict(_ENGINE_OPTIONS)
+    url_object = sqlalchemy.engine.make_url(url)
+    if url_object.get_backend_name() != "sqlite" and "poolclass" not in overrides:
+        options.update(_POOL_OPTIONS)
+    if url_object.get_driver_name() == "psycopg2":
+        options.update(_PSYCOPG2_ENGINE_OPTIONS)
+    options.update(overrides)
+    return sqlalchemy.create_engine(url, **options)
+
+
+# Engines shared per normalized URL. Unbounded: an ETL process uses a handful of databases, and an evicted
+# engine would keep its pooled connections open while a second pool is built for the same URL.
+_SHARED_ENGINES: dict[str, sqlalchemy.engine.Engine] = {}
+_SHARED_ENGINES_LOCK = threading.Lock()
+
+
+def _get_shared_engine(url: str | sqlalchemy.engine.URL) -> sqlalchemy.engine.Engine:
+    """
+    Return the engine (and its connection pool) shared by every caller using the same database URL.
+    Engines are keyed by the normalized URL, so two different databases never share an engine.
+    """
+    key = sqlalchemy.engine.make_url(url).render_as_string(hide_password=False)
+    with _SHARED_ENGINES_LOCK:
+        engine = _SHARED_ENGINES.get(key)
+        if engine is None:
+            engine = _SHARED_ENGINES[key] = _build_engine(key)
+        return engine
+
 
 @dataclass
 class DatabaseConfig:
@@ -16,6 +70,21 @@ class DatabaseConfig:
         metadata={"description": "Database password, default from env var DB_PASSWORD"},
     )
 
+    @property
+    def url(self) -> sqlalchemy.engine.URL:
+        """
+        Return the connection URL as a SQLAlchemy URL object (psycopg2 driver).
+        Credentials are escaped by SQLAlchemy, so passwords may contain '@', ':', '/' or '%'.
+        """
+        return sqlalchemy.engine.URL.create(
+            drivername="postgresql+psycopg2",
+            username=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.database,
+        )
+
     def safe_url(self, show_user: bool = True, show_password: bool = False) -> str:
         """
         Return a safe database URL, with configurable masking.
@@ -30,11 +99,11 @@ class DatabaseConfig:
     def get_sqlalchemy_engine(self, **kwargs) -> sqlalchemy.engine.Engine:
         """
         Build a SQLAlchemy Engine directly.
-        kwargs are passed to sqlalchemy.create_engine (e.g. pool_size, echo).
+        The engine uses a LIFO connection pool (pool_size=10, max_overflow=20, pool_timeout=30,
+        pool_recycle=3600, pool_pre_ping=True).
+        kwargs are passed to sqlalchemy.create_engine (e.g. pool_size, echo) and override these defaults.
         """
-        return sqlalchemy.create_engine(
-            f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}", **kwargs
-        )
+        return _build_engine(self.url, **kwargs)
 
     def __str__(self):
         return f"DatabaseConfig(url : {self.safe_url(show_password=False, show_user=False)})"
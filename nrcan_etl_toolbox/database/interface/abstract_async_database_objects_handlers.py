@@ -0,0 +1,138 @@
+"""
+Interface asynchrone (asyncpg) pour gérer les objets de base de données PostgreSQL.
+
+Nécessite les dépendances optionnelles `async` : `pip install nrcan-etl-toolbox[async]`.
+Ce module n'est donc pas exporté par `nrcan_etl_toolbox.database.interface`.
+"""
+
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import SQLModel
+
+from nrcan_etl_toolbox.database.interface.abstract_database_objects_handlers import _ON_CONFLICT_INSERTS
+from nrcan_etl_toolbox.etl_logging import CustomLogger
+
+T = TypeVar("T", bound="Base")  # noqa: F821
+
+_ASYNC_POOL_OPTIONS = {
+    "poolclass": AsyncAdaptedQueuePool,
+    "pool_size": 20,
+    "max_overflow": 40,
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+}
+
+
+class AbstractAsyncDatabaseObjectsInterface:
+    def __init__(self, database_url: str = None, engine: AsyncEngine = None, logger_level="DEBUG"):
+        """
+        Interface asynchrone de base pour gérer les objets de base de données.
+        Les recherches indépendantes peuvent être lancées en parallèle avec `asyncio.gather`.
+
+        Args:
+            database_url (str): URL de connexion PostgreSQL (SQLAlchemy style), le pilote est remplacé par asyncpg.
+            engine (AsyncEngine): Moteur asynchrone déjà construit.
+            logger_level (str): Niveau de logging (ex: "DEBUG", "INFO").
+        """
+        assert database_url or engine, "You must provide either a database_url or an engine."
+        if engine:
+            self.engine = engine
+        elif database_url:
+            async_url = make_url(database_url).set(drivername="postgresql+asyncpg")
+            self.engine = create_async_engine(async_url, **_ASYNC_POOL_OPTIONS)
+        self._session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.logger = CustomLogger("async_database_objects_handler", logger_type="default")
+
+        self.logger.setLevel(logger_level)
+
+    # --------------------
+    # Session manager
+    # --------------------
+    @asynccontextmanager
+    async def get_session(self) -> AsyncGenerator[AsyncSession, Any]:
+        async with self._session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    # --------------------
+    # READ
+    # --------------------
+    async def _get_element_in_database(self, table_model: type[T], condition: str = "and", **kwargs) -> list[T]:
+        """Récupère des éléments de la DB selon condition."""
+        async with self.get_session() as session:
+            query = table_model.get_query_for_object(session=session, condition=condition, **kwargs)
+            data = (await session.scalars(query)).all()
+            return list(data) or None
+
+    # --------------------
+    # CREATE (insert immédiat)
+    # --------------------
+    async def _create_element(self, table_model: type[T], **kwargs) -> T | None:
+        """
+        Crée et insère immédiatement un nouvel élément en base (`INSERT ... ON CONFLICT DO NOTHING RETURNING`).
+        Si un doublon existe déjà (contrainte unique), on retourne l'objet existant.
+        """
+        if kwargs.keys() & table_model._get_relation_names():
+            return await self._create_element_with_relations(table_model, **kwargs)
+
+        identity_columns = table_model._get_identity_column_names()
+        t = table_model(**{k: v for k, v in kwargs.items() if k not in identity_columns})
+        values = {k: v for k, v in t.model_dump().items() if v is not None and k not in identity_columns}
+        dialect_insert = _ON_CONFLICT_INSERTS[self.engine.dialect.name]
+        stmt = dialect_insert(table_model).values(**values).on_conflict_do_nothing().returning(table_model)
+
+        async with self.get_session() as session:
+            created = (await session.scalars(stmt)).one_or_none()
+        if created is not None:
+            self.logger.debug("Inserted %s with PK=%s", table_model.__name__, created.__dict__.get("id"))
+            return created
+        return await self._get_existing_element(table_model, **kwargs)
+
+    async def _create_element_with_relations(self, table_model: type[T], **kwargs) -> T | None:
+        """
+        Les relations ORM (absentes de `model_dump()`) doivent passer par l'unité de travail
+        pour renseigner les clés étrangères : `session.add()` puis `flush()`.
+        """
+        identity_columns = table_model._get_identity_column_names()
+        try:
+            async with self.get_session() as session:
+                # rattacher les objets ORM à la session
+                merged_kwargs = {k: await session.merge(v) if isinstance(v, SQLModel) else v for k, v in kwargs.items()}
+                t = table_model(**{k: v for k, v in merged_kwargs.items() if k not in identity_columns})
+                session.add(t)
+                await session.flush()  # force l'INSERT
+                await session.refresh(t)  # récupère les PK/valeurs générées
+                session.expunge(t)  # détache l'objet de la session
+        except IntegrityError:
+            return await self._get_existing_element(table_model, **kwargs)
+        self.logger.debug("Inserted %s with PK=%s", table_model.__name__, t.__dict__.get("id"))
+        return t
+
+    async def _get_existing_element(self, table_model: type[T], **kwargs) -> T | None:
+        self.logger.debug("%s already exists, fetching existing one.", table_model.__name__)
+        # récupérer l’existant via les colonnes uniques si dispo, sinon via tous les kwargs
+        filter_kwargs = {k: kwargs[k] for k in kwargs.keys() & table_model._get_unique_keys()} or kwargs
+        existing = await self._get_element_in_database(table_model, **filter_kwargs)
+        return existing[0] if existing else None
+
+    # --------------------
+    # GET OR CREATE
+    # --------------------
+    async def _get_or_create_element(self, table_model: type[T], condition: str = "and", **kwargs) -> list[T | None]:
+        """
+        Cherche un élément en base, sinon le crée immédiatement.
+        """
+        data = await self._get_element_in_database(table_model, condition=condition, **kwargs)
+        if data:
+            return data
+        return [await self._create_element(table_model, **kwargs)]
@@ -1,21 +1,61 @@
+import datetime
+import functools
+import itertools
 import re
-from collections.abc import Generator
+import threading
+import weakref
+from collections.abc import Generator, Iterable, Iterator
 from contextlib import contextmanager
 from typing import Any, Optional, TypeVar
 
 import sqlalchemy
 from dateutil import parser as date_parser
-from sqlalchemy import create_engine
 from sqlalchemy import func as sql_func
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.orm import InstrumentedAttribute, Session, sessionmaker
 from sqlmodel import SQLModel
 
+from nrcan_etl_toolbox.database.database_connection_config import _get_shared_engine
 from nrcan_etl_toolbox.database.orm import FONCTION_FILTER, LIMIT, ORDER_BY
 from nrcan_etl_toolbox.etl_logging import CustomLogger
 
 T = TypeVar("T", bound="Base")  # noqa: F821
 
+DEFAULT_INSERT_CHUNK_SIZE = 1000
+
+_ON_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?$")
+
+# Motifs de normalize_date
+_FULL_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_YEAR_MONTH_RE = re.compile(r"\d{4}-\d{2}")
+_MONTH_YEAR_RE = re.compile(r"\d{2}-\d{4}")
+_YEAR_RE = re.compile(r"\d{4}")
+
+_SCHEMA_LOCK = threading.Lock()
+_SCHEMA_INITIALIZED_ENGINES: weakref.WeakSet = weakref.WeakSet()
+
+
+def _chunked(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    """Découpe un itérable en listes d'au plus `chunk_size` éléments, sans le copier entièrement."""
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+@functools.lru_cache(maxsize=100_000)
+def _is_date_parsable(date_string: str) -> bool:
+    """Interroge dateutil (lent) une seule fois par chaîne : les valeurs de dates se répètent dans les données ETL."""
+    try:
+        # dateutil.parser can handle many date formats
+        date_parser.parse(date_string)
+        return True
+    except (ValueError, TypeError):
+        return False
+
 
 def db_safe(in_func):
     """Décorateur pour logger les erreurs DB sans interrompre sans log clair."""
@@ -31,23 +71,47 @@ def db_safe(in_func):
 
 
 class AbstractDatabaseObjectsInterface:
-    def __init__(self, database_url: str = None, engine: sqlalchemy.engine.Engine = None, logger_level="DEBUG"):
+    def __init__(
+        self,
+        database_url: str = None,
+        engine: sqlalchemy.engine.Engine = None,
+        logger_level="DEBUG",
+        ensure_schema: bool = False,
+    ):
         """
         Interface de base pour gérer les objets de base de données.
 
         Args:
-            database_url (str): URL de connexion à la base (SQLAlchemy style).
+            database_url (str): URL de connexion à la base (SQLAlchemy style). Les instances pointant
+                vers la même URL partagent le même moteur et son pool de connexions.
+            engine (Engine): Moteur SQLAlchemy déjà construit, utilisé tel quel.
             logger_level (str): Niveau de logging (ex: "DEBUG", "INFO").
+            ensure_schema (bool): Crée les tables SQLModel manquantes. Étape d'amorçage (normalement une migration) :
+                effectuée au plus une fois par moteur et par processus.
         """
         assert database_url or engine, "You must provide either a database_url or an engine."
         if engine:
             self.engine = engine
         elif database_url:
-            self.engine = create_engine(database_url, echo=False, future=True)
+            self.engine = _get_shared_engine(database_url)
+        self._session_factory = sessionmaker(bind=self.engine, expire_on_commit=False, autoflush=True)
+        self._readonly_session_factory = sessionmaker(bind=self.engine, expire_on_commit=False, autoflush=False)
         self.logger = CustomLogger("database_objects_handler", logger_type="default")
 
         self.logger.setLevel(logger_level)
 
+        if ensure_schema:
+            self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Exécute `SQLModel.metadata.create_all` une seule fois par moteur dans le processus."""
+        with _SCHEMA_LOCK:
+            if self.engine in _SCHEMA_INITIALIZED_ENGINES:
+                return
+            SQLModel.metadata.create_all(self.engine)
+            _SCHEMA_INITIALIZED_ENGINES.add(self.engine)
+        self.logger.debug("Schema initialized for %s", self.engine.url)
+
     def insert_data(self):
         pass
 
@@ -59,7 +123,7 @@ class AbstractDatabaseObjectsInterface:
     # --------------------
     @contextmanager
     def get_session(self) -> Generator[Session, Any, None]:
-        session = Session(self.engine, expire_on_commit=False, autoflush=True)
+        session = self._session_factory()
         try:
             yield session
             session.commit()
@@ -69,6 +133,15 @@ class AbstractDatabaseObjectsInterface:
         finally:
             session.close()
 
+    @contextmanager
+    def get_readonly_session(self) -> Generator[Session, Any, None]:
+        """Session de lecture seule : pas d'autoflush ni de COMMIT en sortie, seulement `close()`."""
+        session = self._readonly_session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
     def _get_merged_kwargs(self, session, **kwargs) -> dict:
         merged_kwargs = {}
         for k, v in kwargs.items():
@@ -93,47 +166,117 @@ class AbstractDatabaseObjectsInterface:
         with self.get_session() as session:
             merged_kwargs = self._get_merged_kwargs(session, **kwargs)
 
-            t = table_model(**{k: v for k, v in merged_kwargs.items() if not table_model.is_identity_column(k)})
+            identity_columns = table_model._get_identity_column_names()
+            t = table_model(**{k: v for k, v in merged_kwargs.items() if k not in identity_columns})
             try:
-                session.add(t)
-                session.flush()  # force l'INSERT
-                session.refresh(t)  # récupère les PK/valeurs générées
+                if merged_kwargs.keys() & table_model._get_relation_names():
+                    # Les relations ORM doivent passer par l'unité de travail pour renseigner les clés étrangères.
+                    session.add(t)
+                    session.flush()  # force l'INSERT
+                    session.refresh(t)  # récupère les PK/valeurs générées
+                else:
+                    # INSERT ... RETURNING : insertion et récupération des valeurs générées en un seul aller-retour.
+                    stmt = insert(table_model).values(**self._get_insert_mapping(table_model, t)).returning(table_model)
+                    t = session.scalars(stmt).one()
                 session.expunge(t)  # détache l'objet de la session
-                self.logger.debug(f"Inserted {type(t).__name__} with PK={t.__dict__.get('id')}")
+                self.logger.debug("Inserted %s with PK=%s", type(t).__name__, t.__dict__.get("id"))
                 return t
 
             except IntegrityError as e:
                 self.logger.error(f"IntegrityError: {e}")
                 session.rollback()
-                self.logger.debug(f"{type(t).__name__} already exists, fetching existing one.")
-                # récupérer l’existant via les colonnes uniques si dispo
-                filter_kwargs = {
-                    k: v
-                    for k, v in kwargs.items()
-                    if hasattr(table_model, "unique_keys") and k in table_model.unique_keys()
-                }
-                if not filter_kwargs:
-                    filter_kwargs = kwargs  # fallback : utiliser tous les kwargs
+                self.logger.debug("%s already exists, fetching existing one.", type(t).__name__)
+                # récupérer l’existant via les colonnes uniques si dispo, sinon via tous les kwargs
+                filter_kwargs = {k: kwargs[k] for k in kwargs.keys() & table_model._get_unique_keys()} or kwargs
 
                 existing = self._get_element_in_database(table_model, **filter_kwargs)
                 return existing[0] if existing else None
 
+    # --------------------
+    # CREATE (insertion en lot)
+    # --------------------
+    def _get_insert_mapping(self, table_model: type[T], element: dict | T) -> dict:
+        """Convertit un élément (dict ou objet ORM) en dictionnaire de colonnes à insérer."""
+        if isinstance(element, SQLModel):
+            element = {k: v for k, v in element.model_dump().items() if v is not None}
+        identity_columns = table_model._get_identity_column_names()
+        return {k: v for k, v in element.items() if k not in identity_columns}
+
+    def _get_insert_ignore_statement(self, table_model: type[T]):
+        """Construit un `INSERT ... ON CONFLICT DO NOTHING` pour le dialecte du moteur."""
+        dialect_insert = _ON_CONFLICT_INSERTS.get(self.engine.dialect.name)
+        if dialect_insert is None:
+            raise NotImplementedError(
+                f"ON CONFLICT DO NOTHING is not supported by dialect '{self.engine.dialect.name}'"
+            )
+        return dialect_insert(table_model).on_conflict_do_nothing()
+
+    def _insert_rows_isolating_conflicts(self, session: Session, table_model: type[T], rows: list[dict]) -> int:
+        """
+        Insère `rows` en un seul `executemany`. Sur IntegrityError, le lot est coupé en deux et chaque moitié
+        est reprise dans son propre SAVEPOINT, jusqu'à isoler les lignes en doublon, qui sont ignorées.
+
+        Returns:
+            int: Nombre de lignes insérées.
+        """
+        try:
+            with session.begin_nested():
+                session.execute(insert(table_model), rows)
+            return len(rows)
+        except IntegrityError:
+            if len(rows) == 1:
+                self.logger.debug("%s already exists, skipped: %s", table_model.__name__, rows[0])
+                return 0
+            middle = len(rows) // 2
+            inserted = self._insert_rows_isolating_conflicts(session, table_model, rows[:middle])
+            return inserted + self._insert_rows_isolating_conflicts(session, table_model, rows[middle:])
+
+    @db_safe
+    def _create_elements(
+        self, table_model: type[T], elements: Iterable[dict | T], chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE
+    ) -> int:
+        """
+        Insère une liste d'éléments en lot, par paquets de `chunk_size` lignes.
+
+        Chaque paquet est envoyé en une seule instruction `INSERT ... ON CONFLICT DO NOTHING`
+        et validé par un seul commit : les doublons sont ignorés par la base sans aller-retour supplémentaire.
+        Pour les dialectes sans `ON CONFLICT`, le paquet est envoyé en `executemany` et seules les
+        moitiés en échec sont reprises (voir `_insert_rows_isolating_conflicts`).
+
+        Args:
+            table_model: Modèle ORM cible.
+            elements: Dictionnaires de colonnes ou objets ORM à insérer (liste ou générateur,
+                consommé paquet par paquet sans copie complète).
+            chunk_size: Nombre de lignes par paquet.
+
+        Returns:
+            int: Nombre de lignes réellement insérées.
+        """
+        stmt = None
+        if self.engine.dialect.name in _ON_CONFLICT_INSERTS:
+            stmt = self._get_insert_ignore_statement(table_model).returning(*table_model.__table__.primary_key.columns)
+        inserted = total = 0
+        for chunk in _chunked(elements, chunk_size):
+            rows = [self._get_insert_mapping(table_model, element) for element in chunk]
+            with self.get_session() as session:
+                if stmt is not None:
+                    inserted += len(session.execute(stmt, rows).all())
+                else:
+                    inserted += self._insert_rows_isolating_conflicts(session, table_model, rows)
+            total += len(rows)
+        self.logger.debug("Inserted %s/%s %s", inserted, total, table_model.__name__)
+        return inserted
+
     # --------------------
     # READ
     # --------------------
     @db_safe
     def _get_element_in_database(self, table_model: type[T], condition: str = "and", **kwargs) -> list[T]:
         """Récupère des éléments de la DB selon condition."""
-        with self.get_session() as session:
+        with self.get_readonly_session() as session:
             merged_kwargs = self._get_merged_kwargs(session, **kwargs)
-            data = table_model.query_object(session=session, condition=condition, **merged_kwargs)
-            if not data or len(data) == 0:
-                return None
-            for obj in data:
-                obj = session.merge(obj)
-                session.refresh(obj)
-                session.expunge(obj)
-            return data
+            # query_object charge des objets à jour et détachés : pas de merge/refresh supplémentaire
+            return table_model.query_object(session=session, condition=condition, **merged_kwargs) or None
 
     # --------------------
     # GET OR CREATE
@@ -147,6 +290,66 @@ class AbstractDatabaseObjectsInterface:
             return data
         return [self._create_element(table_model, **kwargs)]
 
+    @staticmethod
+    def _select_elements_by_key(session: Session, table_model: type[T], unique_cols: list[str], keys: Iterable[tuple]):
+        """Charge en un seul SELECT les éléments dont les colonnes `unique_cols` valent l'une des clés `keys`."""
+        key_columns = [getattr(table_model, col) for col in unique_cols]
+        found = session.scalars(select(table_model).where(tuple_(*key_columns).in_(set(keys)))).all()
+        return {tuple(getattr(obj, col) for col in unique_cols): obj for obj in found}
+
+    @db_safe
+    def _get_or_create_elements_bulk(self, table_model: type[T], rows: list[dict]) -> list[T | None]:
+        """
+        Version en lot de `_get_or_create_element` : un seul SELECT pour toutes les lignes,
+        puis un seul `INSERT ... ON CONFLICT DO NOTHING RETURNING` pour les lignes manquantes.
+        Les lignes ignorées par l'INSERT (insérées entre-temps par une autre transaction) sont relues,
+        et les dialectes sans `ON CONFLICT` passent par `_insert_rows_isolating_conflicts`.
+
+        Les lignes sont identifiées par les colonnes de `table_model.unique_keys()` si le modèle
+        les définit, sinon par l'ensemble des colonnes fournies dans `rows`. Une clé contenant NULL
+        ne peut être retrouvée ni par `IN` ni par `ON CONFLICT` : ces lignes passent par `_get_or_create_element`.
+
+        Args:
+            table_model: Modèle ORM cible.
+            rows: Dictionnaires de colonnes, un par élément recherché.
+
+        Returns:
+            list: Les objets trouvés ou créés, alignés sur `rows` (None si l'objet n'a pu être obtenu).
+        """
+        if not rows:
+            return []
+        rows = [self._get_insert_mapping(table_model, row) for row in rows]
+        unique_cols = list(table_model._get_unique_keys() or dict.fromkeys(col for row in rows for col in row))
+        keys = [tuple(row.get(col) for col in unique_cols) for row in rows]
+        rows_by_key = {key: row for key, row in zip(keys, rows, strict=True) if None not in key}
+
+        with self.get_session() as session:
+            elements_by_key = self._select_elements_by_key(session, table_model, unique_cols, rows_by_key)
+            found = len(elements_by_key)
+            missing_rows = {key: row for key, row in rows_by_key.items() if key not in elements_by_key}
+            if missing_rows:
+                if self.engine.dialect.name in _ON_CONFLICT_INSERTS:
+                    stmt = self._get_insert_ignore_statement(table_model).returning(table_model)
+                    for obj in session.scalars(stmt, list(missing_rows.values())).all():
+                        elements_by_key[tuple(getattr(obj, col) for col in unique_cols)] = obj
+                else:
+                    self._insert_rows_isolating_conflicts(session, table_model, list(missing_rows.values()))
+                if still_missing := [key for key in missing_rows if key not in elements_by_key]:
+                    elements_by_key.update(
+                        self._select_elements_by_key(session, table_model, unique_cols, still_missing)
+                    )
+            session.expunge_all()
+
+        self.logger.debug(
+            "%s %s requested, %s found, %s to create", len(rows), table_model.__name__, found, len(missing_rows)
+        )
+        return [
+            self._get_or_create_element(table_model, condition="and", **row)[0]
+            if None in key
+            else elements_by_key.get(key)
+            for key, row in zip(keys, rows, strict=True)
+        ]
+
     @staticmethod
     def _get_bool_op_filter(in_col: InstrumentedAttribute, text_to_compare: str, operator: str):
         """Helper pour appliquer un opérateur booléen PostgreSQL."""
@@ -167,18 +370,21 @@ class AbstractDatabaseObjectsInterface:
 
     @staticmethod
     def _get_similarity_func_and_order_by_for_column(column, element, similarity_filter=0.3, result_limit=10) -> dict:
-        similarity_funcs = []
+        """
+        Filtres de similarité (un seuil par colonne, combinés par la `condition` de la requête)
+        et tri par similarité sur la première colonne.
+        """
         if isinstance(column, (InstrumentedAttribute, str)):
-            similarity_funcs.append(AbstractDatabaseObjectsInterface._get_similarity_func(column, element))
-        elif isinstance(column, list):
-            for col in column:
-                similarity_funcs.append(AbstractDatabaseObjectsInterface._get_similarity_func(col, element))
+            column = [column]
+        elif not isinstance(column, list):
+            return {FONCTION_FILTER: [], ORDER_BY: None, LIMIT: result_limit}
 
+        similarity_funcs = [AbstractDatabaseObjectsInterface._get_similarity_func(col, element) for col in column]
         if not similarity_funcs:
-            return {FONCTION_FILTER: {}, ORDER_BY: None, LIMIT: result_limit}
+            return {FONCTION_FILTER: [], ORDER_BY: None, LIMIT: result_limit}
 
         return {
-            FONCTION_FILTER: [i > similarity_filter for i in similarity_funcs],
+            FONCTION_FILTER: [similarity_func > similarity_filter for similarity_func in similarity_funcs],
             ORDER_BY: sqlalchemy.desc(similarity_funcs[0]),
             LIMIT: result_limit,
         }
@@ -196,12 +402,16 @@ class AbstractDatabaseObjectsInterface:
         """
         if not isinstance(date_string, str):
             return False
-        try:
-            # dateutil.parser can handle many date formats
-            date_parser.parse(date_string)
-            return True
-        except (ValueError, TypeError):
-            return False
+        if _ISO_DATE_RE.match(date_string):
+            # Chemin rapide (parseur C) pour le cas courant ISO-8601 ; fromisoformat n'accepte "Z" qu'à partir de 3.11
+            try:
+                datetime.datetime.fromisoformat(
+                    date_string[:-1] + "+00:00" if date_string.endswith("Z") else date_string
+                )
+                return True
+            except ValueError:
+                pass
+        return _is_date_parsable(date_string)
 
     @staticmethod
     # Clean the values – extract patterns like YYYY or YYYY-MM-DD
@@ -221,10 +431,10 @@ class AbstractDatabaseObjectsInterface:
             Normalized date string in the format YYYY-MM-DD or None if no valid date pattern is found.
         """
         # Try to find YYYY-MM-DD
-        match_full = re.search(r"\d{4}-\d{2}-\d{2}", input_date)
-        match_year_month = re.search(r"\d{4}-\d{2}", input_date)
-        match_month_year = re.search(r"\d{2}-\d{4}", input_date)
-        match_year = re.search(r"\d{4}", input_date)
+        match_full = _FULL_DATE_RE.search(input_date)
+        match_year_month = _YEAR_MONTH_RE.search(input_date)
+        match_month_year = _MONTH_YEAR_RE.search(input_date)
+        match_year = _YEAR_RE.search(input_date)
 
         # Try to find just YYYY-MM-dd
         if match_full:
@@ -244,10 +454,12 @@ class AbstractDatabaseObjectsInterface:
 
     @db_safe
     def _associate_elements(self, elements: list["Base"], associate_to: list["Base"]):  # noqa: F821
+        # Parcours de liste conservé : Base.__eq__ (colonnes non nulles de l'élément déjà associé) n'est pas
+        # cohérent avec Base.__hash__ (toutes les colonnes), un index haché manquerait ces doublons.
         for elt in elements:
             if elt and elt not in associate_to:
                 associate_to.append(elt)
-                self.logger.debug(f"Associated {elt} to {associate_to}")
+                self.logger.debug("Associated %s (%s associated elements)", elt, len(associate_to))
                 with self.get_session() as session:
                     elt = session.merge(elt)
                     session.expunge(elt)
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-import json
-import sys
+import functools
+import logging
+import re
+import unicodedata
 from collections.abc import Callable
 from typing import Any, TypeVar
 
 import sqlalchemy.schema
 from geoalchemy2 import WKBElement
 from shapely.geometry.base import BaseGeometry
-from sqlalchemy import String, Text, func, or_, orm
+from sqlalchemy import Select, String, Text, func, or_, orm, select
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.orm import ColumnProperty, InstrumentedAttribute, Query
+from sqlalchemy.orm import ColumnProperty, InstrumentedAttribute
 from sqlmodel import AutoString, SQLModel
 
 from nrcan_etl_toolbox.etl_logging import CustomLogger
@@ -22,43 +24,77 @@ ORDER_BY = "order_by"
 LIMIT = "limit"
 OFFSET = "offset"
 
+_NO_DEFAULT = "no_default"
+_CONSTANT_DEFAULT = "constant_default"
+_CALLABLE_DEFAULT = "callable_default"
+
 logger = CustomLogger("SQLModels")
 
 T = TypeVar("T", bound="Base")
 
 
-sys.stdout.reconfigure(encoding="utf-8")
-sys.stderr.reconfigure(encoding="utf-8")
+# Dialect used to render queries in debug logs, built once instead of on every query.
+_DEBUG_DIALECT = postgresql.dialect()
+
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_for_like(input_string: str) -> str:
+    """Replace accented chars by underscores for LIKE queries. Cached: ETL filters repeat the same values."""
+    if input_string.isascii():
+        return input_string
+    # NFC first: a decomposed letter (base + combining accent) becomes one character, hence one "_"
+    return _NON_ASCII_RE.sub("_", unicodedata.normalize("NFC", input_string))
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_like_parameter(parameter: str) -> str:
+    parameter_norm = _normalize_for_like(parameter)
+    return "%" if parameter_norm == "%" else f"%{parameter_norm.lower()}%"
+
+
+def _hashable_value(value: Any) -> Any:
+    """Hashable equivalent of a JSON-like value: dicts become key-sorted tuples of pairs, lists become tuples."""
+    match value:
+        case dict():
+            return tuple(sorted((key, _hashable_value(item)) for key, item in value.items()))
+        case list():
+            return tuple(_hashable_value(item) for item in value)
+        case _:
+            return value
 
 
 class Base(SQLModel):
     __abstract__ = True
 
     def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
         if not isinstance(other, type(self)):
             return False
-        cols = self._get_columns_if_not_auto_gen()
-        for col in cols:
-            v1 = getattr(self, col)
-            v2 = getattr(other, col)
-            if isinstance(v1, dict) and isinstance(v2, dict):
-                if json.dumps(v1, sort_keys=True) != json.dumps(v2, sort_keys=True):
-                    return False
-            else:
-                if v1 != v2:
-                    return False
-        return True
+        # Loaded values are read from the instance __dict__, getattr only for unloaded or expired attributes.
+        self_values, other_values = self.__dict__, other.__dict__
+        # A differing primary key settles it without introspecting every column default.
+        for col in self._get_compared_primary_key_names():
+            v1 = self_values[col] if col in self_values else getattr(self, col)
+            if v1 is not None and v1 != (other_values[col] if col in other_values else getattr(other, col)):
+                return False
+        # dict equality ignores key order already: no need to serialize JSON columns to compare them
+        return all(
+            (self_values[col] if col in self_values else getattr(self, col))
+            == (other_values[col] if col in other_values else getattr(other, col))
+            for col in self._get_columns_if_not_auto_gen()
+        )
 
     def __hash__(self):
-        cols = self._get_columns_if_not_auto_gen()
-        vals = []
-        for col in cols:
-            v = getattr(self, col)
-            if isinstance(v, dict):
-                vals.append(json.dumps(v, sort_keys=True))
-            else:
-                vals.append(v)
-        return hash(tuple(vals))
+        values = self.__dict__
+        return hash(
+            tuple(
+                _hashable_value(values[col] if col in values else getattr(self, col))
+                for col in self._get_columns_if_not_auto_gen()
+            )
+        )
 
     @classmethod
     def primary_key_is_completed(cls) -> bool:
@@ -71,7 +107,7 @@ class Base(SQLModel):
 
     @property
     def get_identity_columns(self):
-        return [i for i in self._get_columns() if self.is_identity_column(i)]
+        return [i for i in self._get_column_names() if self.is_identity_column(i)]
 
     @property
     def relations(self):
@@ -79,69 +115,138 @@ class Base(SQLModel):
 
     @classmethod
     def _get_relations(cls):
-        relations = []
-        for attr_name, attr_value in vars(cls).items():
-            if isinstance(attr_value, InstrumentedAttribute) and isinstance(
-                attr_value.property, orm.RelationshipProperty
-            ):
-                relations.append(attr_name)
-        return relations
+        return list(cls._get_relation_names())
+
+    @classmethod
+    @functools.cache
+    def _get_relation_names(cls) -> tuple[str, ...]:
+        """Names of the relationship attributes, computed once per model class."""
+        return tuple(
+            attr_name
+            for attr_name, attr_value in vars(cls).items()
+            if isinstance(attr_value, InstrumentedAttribute)
+            and isinstance(attr_value.property, orm.RelationshipProperty)
+        )
 
     @classmethod
     def _get_columns(cls) -> list:
-        return [i for i in cls.model_fields]
+        return list(cls._get_column_names())
+
+    @classmethod
+    @functools.cache
+    def _get_column_names(cls) -> tuple[str, ...]:
+        """Names of the model fields, computed once per model class."""
+        return tuple(cls.model_fields)
+
+    @classmethod
+    @functools.cache
+    def _get_textual_column_names(cls) -> frozenset[str]:
+        """Names of the mapped columns with a textual type (LIKE filters apply), computed once per model class."""
+        return frozenset(
+            column_property.key
+            for column_property in sqlalchemy.inspect(cls).column_attrs
+            if isinstance(column_property.columns[0].type, (String, Text, AutoString))
+        )
+
+    @classmethod
+    @functools.cache
+    def _get_non_identity_column_names(cls) -> tuple[str, ...]:
+        """Names of the model fields that are not identity columns, computed once per model class."""
+        identity_columns = cls._get_identity_column_names()
+        return tuple(name for name in cls._get_column_names() if name not in identity_columns)
 
     def _get_columns_if_not_auto_gen(self):
-        out_cols = []
-        for cols in self._get_columns():
-            if not self._is_value_null(cols) and not self.is_identity_column(cols):
-                if self._is_default_callable(cols):
-                    if not self._is_value_equal_default_gen_col(cols):
-                        out_cols.append(cols)
-                else:
-                    out_cols.append(cols)
-        return out_cols
+        # A value produced by a callable default (timestamp, uuid...) is compared like any other value:
+        # checking it against a fresh call of the default made equality and hashing time-dependent.
+        # Loaded values live in the instance __dict__; getattr is only needed for unloaded or expired attributes.
+        values = self.__dict__
+        return [
+            col
+            for col in self._get_non_identity_column_names()
+            if (values[col] if col in values else getattr(self, col, None)) is not None
+        ]
+
+    @classmethod
+    @functools.cache
+    def _get_column_default(cls, column_name: str) -> tuple[str, Any]:
+        """
+        Classify the Python-side default of a column, computed once per model class and column.
+
+        Returns:
+            tuple: (_NO_DEFAULT, None), (_CONSTANT_DEFAULT, value) or (_CALLABLE_DEFAULT, None).
+        """
+        try:
+            default = getattr(cls, column_name).property.columns[0].default
+        except AttributeError:
+            return _NO_DEFAULT, None
+        if default is None:
+            return _NO_DEFAULT, None
+        arg = getattr(default, "arg", None)
+        if arg is None or isinstance(arg, Callable):
+            return _CALLABLE_DEFAULT, None
+        return _CONSTANT_DEFAULT, arg
 
     def _is_default_value_null(self, column_name: str) -> bool:
         if hasattr(self, column_name):
-            col_attribute = getattr(type(self), column_name).property.columns[0]
-            return col_attribute.default is None
+            return self._get_column_default(column_name)[0] == _NO_DEFAULT
         return False
 
     def _is_value_null(self, column_name: str) -> bool:
         return getattr(self, column_name, None) is None
 
     def _is_value_equal_default_gen_col(self, column_name: str) -> bool:
+        """True when the value equals a constant default. Callable defaults are never invoked."""
         if hasattr(self, column_name):
-            col_attribute = getattr(type(self), column_name).property.columns[0]
-            if not self._is_default_value_null(column_name):
-                col_value = getattr(self, column_name)
-                if not self._is_default_callable(column_name):
-                    return col_value == col_attribute.default.arg
-                try:
-                    return col_attribute.default.arg() == col_value
-                except TypeError:
-                    return col_attribute.default.arg(None) == col_value
+            default_kind, default_value = self._get_column_default(column_name)
+            if default_kind == _CONSTANT_DEFAULT:
+                return getattr(self, column_name) == default_value
         return False
 
-    def _is_default_callable(self, column_name: str):
-        if hasattr(self, column_name) and not self._is_default_value_null(column_name):
-            col_attribute = getattr(type(self), column_name).property.columns[0]
-            return isinstance(col_attribute.default.arg, Callable)
+    def _is_default_callable(self, column_name: str) -> bool:
+        return hasattr(self, column_name) and self._get_column_default(column_name)[0] == _CALLABLE_DEFAULT
 
     @classmethod
     def is_identity_column(cls, column_name: str) -> bool:
         """Check if a column is an identity/auto-increment column."""
-        if column_name in cls.model_fields:
-            column = getattr(cls, column_name)
+        return column_name in cls._get_identity_column_names()
+
+    @classmethod
+    @functools.cache
+    def _get_identity_column_names(cls) -> frozenset[str]:
+        """Names of the identity/auto-increment columns, computed once per model class."""
+        identity_columns = set()
+        for column_name in cls.model_fields:
             try:
-                return column.property.columns[0].identity is not None
+                if getattr(cls, column_name).property.columns[0].identity is not None:
+                    identity_columns.add(column_name)
             except AttributeError:
-                return False
-        return False
+                continue
+        return frozenset(identity_columns)
+
+    @classmethod
+    @functools.cache
+    def _get_compared_primary_key_names(cls) -> tuple[str, ...]:
+        """
+        Primary key columns always compared by `__eq__` when set (identity columns are excluded),
+        computed once per model class.
+        """
+        table = getattr(cls, "__table__", None)
+        if table is None:
+            return ()
+        return tuple(
+            column.name
+            for column in table.primary_key.columns
+            if column.name in cls.model_fields and not cls.is_identity_column(column.name)
+        )
+
+    @classmethod
+    @functools.cache
+    def _get_unique_keys(cls) -> frozenset[str]:
+        """Columns returned by the model's optional `unique_keys()` classmethod, computed once per model class."""
+        return frozenset(cls.unique_keys()) if hasattr(cls, "unique_keys") else frozenset()
 
     @classmethod
-    def query_all_rows(cls: type[T], session) -> list[T] | None:
+    def query_all_rows(cls: type[T], session) -> list[T]:
         return cls.query_object(session=session, condition="all")
 
     @classmethod
@@ -151,8 +256,8 @@ class Base(SQLModel):
         condition="or",
         add_is_like_to_query=True,
         **filters,
-    ) -> Query | None:
-        query = session.query(cls)
+    ) -> Select:
+        query = select(cls)
         sub_filters = []
 
         if condition not in ["or", "and", "all"]:
@@ -165,9 +270,14 @@ class Base(SQLModel):
                 column_attr = getattr(cls, attr)
                 if isinstance(column_attr, (InstrumentedAttribute, ColumnProperty)):
                     match value:
+                        case list() if condition == "or":
+                            cls.add_values_to_sub_query(column_attr, sub_filters, value, add_is_like_to_query)
                         case list():
+                            col_type = column_attr.property.columns[0].type
                             for v in value:
-                                cls.add_value_to_sub_query(column_attr, sub_filters, v, add_is_like_to_query)
+                                cls.add_value_to_sub_query(
+                                    column_attr, sub_filters, v, add_is_like_to_query, col_type=col_type
+                                )
                         case BaseGeometry():
                             pass
                         case _:
@@ -178,9 +288,9 @@ class Base(SQLModel):
 
         if sub_filters:
             if condition == "or":
-                query = query.filter(or_(*sub_filters))
+                query = query.where(or_(*sub_filters))
             if condition == "and":
-                query = query.filter(*sub_filters)
+                query = query.where(*sub_filters)
 
         if query.whereclause is None:
             raise ValueError("No conditions provided with parameter 'condition' = 'or' or 'and'")
@@ -192,18 +302,13 @@ class Base(SQLModel):
         if OFFSET in filters and isinstance(filters[OFFSET], int):
             query = query.offset(filters[OFFSET])
 
-        try:
-            compiled_query = query.statement.compile(
-                dialect=postgresql.dialect(),
-                compile_kwargs={"literal_binds": True},
-            )
-        except sqlalchemy.exc.CompileError:
-            compiled_query = query.statement.compile(dialect=postgresql.dialect())
-        finally:
+        # Rendering the SQL with literal binds is costly: only do it when the debug message will be emitted.
+        if logger.isEnabledFor(logging.DEBUG):
             try:
-                logger.debug(f"{compiled_query}")
-            except Exception:
-                logger.debug(f"{query}")
+                compiled_query = query.compile(dialect=_DEBUG_DIALECT, compile_kwargs={"literal_binds": True})
+            except sqlalchemy.exc.CompileError:
+                compiled_query = query.compile(dialect=_DEBUG_DIALECT)
+            logger.debug("%s", compiled_query)
 
         return query
 
@@ -215,26 +320,25 @@ class Base(SQLModel):
         add_is_like_to_query=True,
         funcs_conditions="and",
         **filters,
-    ) -> list[T] | None:
-        try:
-            objects = cls.get_query_for_object(
-                session=session,
-                condition=condition,
-                funcs_conditions=funcs_conditions,
-                add_is_like_to_query=add_is_like_to_query,
-                **filters,
-            ).all()
-            for obj in objects:
-                session.refresh(obj)
-                session.expunge(obj)
-            return objects
-        except AttributeError as e:
-            logger.error(e)
-            return None
+    ) -> list[T]:
+        query = cls.get_query_for_object(
+            session=session,
+            condition=condition,
+            funcs_conditions=funcs_conditions,
+            add_is_like_to_query=add_is_like_to_query,
+            **filters,
+        )
+        # populate_existing refreshes objects already in the identity map within the same SELECT
+        objects = session.scalars(query.execution_options(populate_existing=True)).all()
+        for obj in objects:
+            session.expunge(obj)
+        return list(objects)
 
     @classmethod
-    def add_value_to_sub_query(cls, column_attr, sub_filters, value, add_is_like_to_query=True):
-        col_type = column_attr.property.columns[0].type
+    def add_value_to_sub_query(cls, column_attr, sub_filters, value, add_is_like_to_query=True, col_type=None):
+        # col_type can be given by callers adding several values for the same column
+        if col_type is None:
+            col_type = column_attr.property.columns[0].type
 
         if isinstance(col_type, JSONB) and isinstance(value, dict):
             pass
@@ -242,21 +346,41 @@ class Base(SQLModel):
             sub_filters.append(value == column_attr)
         else:
             sub_filters.append(column_attr == value)
-            # Ajout LIKE seulement si type textuel
-            if isinstance(col_type, (String, Text, AutoString)) and add_is_like_to_query:
+            # Ajout LIKE seulement si type textuel et valeur texte (`_is_like` ne donne aucun filtre sinon)
+            if (
+                add_is_like_to_query
+                and isinstance(value, str)
+                and value != "%"
+                and column_attr.key in cls._get_textual_column_names()
+            ):
                 sub_filters.append(cls._is_like(column_attr, value))
 
+    @classmethod
+    def add_values_to_sub_query(cls, column_attr, sub_filters, values: list, add_is_like_to_query=True):
+        """
+        Equivalent of `add_value_to_sub_query` for each value when the filters are combined with OR:
+        a single `IN (...)` replaces one equality per value, LIKE filters are still added per value.
+        """
+        col_type = column_attr.property.columns[0].type
+        in_values = [v for v in values if v is not None and not (isinstance(col_type, JSONB) and isinstance(v, dict))]
+        if in_values:
+            sub_filters.append(column_attr.in_(in_values))
+        if any(v is None for v in values):
+            sub_filters.append(column_attr.is_(None))
+        # Ajout LIKE seulement si type textuel
+        if add_is_like_to_query and column_attr.key in cls._get_textual_column_names():
+            sub_filters.extend(cls._is_like(column_attr, v) for v in in_values if isinstance(v, str) and v != "%")
+
     @staticmethod
     def remove_accents_characters_from_string(input_string: str) -> str:
         """Replace accented chars by underscores for LIKE queries."""
         if isinstance(input_string, list):
             input_string = "".join(input_string)
-        return "".join("_" if ord(c) > 127 else c for c in input_string)
+        return _normalize_for_like(input_string)
 
     @classmethod
     def _formatted_parameter(cls, parameter: str) -> str:
-        parameter_norm = cls.remove_accents_characters_from_string(parameter)
-        return "%" if parameter_norm == "%" else f"%{parameter_norm.lower()}%"
+        return _format_like_parameter(parameter)
 
     @classmethod
     def _is_like(cls, col: InstrumentedAttribute, parameter: str = None):
@@ -279,6 +403,26 @@ class Base(SQLModel):
         Returns:
             Any or None: The default value, or None if no default is defined.
         """
+        column_default = cls._get_column_default_arg(column_name)
+        if column_default is None:
+            return None
+        # Callable defaults are still called every time: only the column lookup is cached.
+        arg, is_server_default = column_default
+        value = cls._get_arg_default(arg)
+        return str(value) if is_server_default else value
+
+    @classmethod
+    @functools.cache
+    def _get_column_default_arg(cls, column_name) -> tuple[Any, bool] | None:
+        """
+        Returns the default argument of a column and whether it is server-side, computed once per class and column.
+
+        Args:
+            column_name (str): The name of the column.
+
+        Returns:
+            tuple or None: (default argument, is server default), or None if no default is defined.
+        """
         if not hasattr(cls, column_name):
             return None
 
@@ -290,21 +434,22 @@ class Base(SQLModel):
 
         match column.default, column.server_default:
             case (default, _) if default is not None:
-                return cls._get_arg_default(default.arg)
+                return default.arg, False
 
             case (_, server_default) if server_default is not None:
-                return str(cls._get_arg_default(server_default.arg))
+                return server_default.arg, True
 
             case _:
                 return None
 
     @staticmethod
     def _get_arg_default(arg):
+        # Unwrap defaults pointing to another column
+        while isinstance(arg, sqlalchemy.schema.Column):
+            arg = arg.default.arg
         match arg:
             case str():
                 return arg
-            case sqlalchemy.schema.Column():
-                return Base._get_arg_default(arg.default.arg)
             case _ if callable(arg):
                 try:
                     return arg()
@@ -1,23 +1,44 @@
+import atexit
 import datetime
 import logging
+import logging.handlers
 import os
 import pathlib
+import queue
 import tempfile
+import threading
+import weakref
 from typing import Union
 
 import dotenv
 
 dotenv.load_dotenv()
 
-DEFAULT_FORMATTER = logging.Formatter(
+
+class CachedFormatter(logging.Formatter):
+    """
+    Formatter keeping its last output on the record: the stream and file handlers of a logger share
+    the same formatter, so each record is formatted once instead of once per handler.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        if record.__dict__.get("_cached_formatter") is self:
+            return record._cached_message
+        message = super().format(record)
+        record._cached_formatter = self
+        record._cached_message = message
+        return message
+
+
+DEFAULT_FORMATTER = CachedFormatter(
     "%(asctime)s :: [%(name)-10s :: %(levelname)-10s]  %(module)-8s :: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-VERBOSE_FORMATER = logging.Formatter(
+VERBOSE_FORMATER = CachedFormatter(
     "%(asctime)s :: [%(name)-10s :: %(levelname)-8s] %(module)-8s :: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-SIMPLE_FORMATTER = logging.Formatter("%(asctime)s :: %(levelname)-8s :: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+SIMPLE_FORMATTER = CachedFormatter("%(asctime)s :: %(levelname)-8s :: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
 
 VERBOSE = bool(int(os.environ.get("VERBOSE_LOGGER", False)))
 
@@ -40,6 +61,139 @@ PROGRESS_LEVELV_NUM = 60
 logging.addLevelName(PROGRESS_LEVELV_NUM, "PROGRESS")
 
 
+class _LoggerQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records with the output handlers of the logger that emitted them."""
+
+    def __init__(self, output_handlers: list[logging.Handler]):
+        super().__init__(_LOG_QUEUE)
+        self.output_handlers = output_handlers
+
+    def enqueue(self, record: logging.LogRecord):
+        if not _log_dispatcher_started:
+            # Dispatcher stopped at exit: records logged by the atexit handlers that run later are written now
+            _write_record_now(record, self.output_handlers)
+            return
+        # Module queue rather than self.queue: a forked child replaces it with its own queue
+        _LOG_QUEUE.put_nowait((record, tuple(self.output_handlers)))
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler writing through a 64 KiB buffer. It is not flushed after every record: the log dispatcher
+    flushes it once the queue is empty, so a burst of records becomes a few large writes.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=64 * 1024, encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        # Called by emit() after each record: left to the dispatcher (close() still flushes the stream)
+        pass
+
+    def flush_buffer(self):
+        super().flush()
+
+
+def _write_record_now(record: logging.LogRecord, output_handlers):
+    """Writes a record to the output handlers on the calling thread, without waiting for a buffer flush."""
+    for handler in output_handlers:
+        if record.levelno >= handler.level:
+            handler.handle(record)
+            if isinstance(handler, _BufferedFileHandler):
+                handler.flush_buffer()
+
+
+class _LogDispatcher(logging.handlers.QueueListener):
+    """Background listener writing each record to the output handlers it was enqueued with."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._unflushed_handlers: set[_BufferedFileHandler] = set()
+
+    def handle(self, item):
+        record, output_handlers = item
+        for handler in output_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+                if isinstance(handler, _BufferedFileHandler):
+                    self._unflushed_handlers.add(handler)
+        if self.queue.empty():
+            for handler in self._unflushed_handlers:
+                handler.flush_buffer()
+            self._unflushed_handlers.clear()
+
+
+# Stream and file writes happen on a single background thread shared by every CustomLogger:
+# the logging call only formats the message and enqueues it.
+_LOG_QUEUE = queue.Queue(-1)
+_LOG_DISPATCHER = _LogDispatcher(_LOG_QUEUE)
+_LOG_DISPATCHER_LOCK = threading.Lock()
+_log_dispatcher_started = False
+
+
+def _start_log_dispatcher():
+    global _log_dispatcher_started
+    with _LOG_DISPATCHER_LOCK:
+        if not _log_dispatcher_started:
+            _LOG_DISPATCHER.start()
+            _log_dispatcher_started = True
+
+
+def _stop_log_dispatcher():
+    """
+    Writes the pending records and stops the background thread. Records logged afterwards are written
+    synchronously by the queue handlers.
+    """
+    global _log_dispatcher_started
+    with _LOG_DISPATCHER_LOCK:
+        if _log_dispatcher_started:
+            _log_dispatcher_started = False
+            _LOG_DISPATCHER.stop()
+            # Records enqueued by another thread after the stop sentinel
+            while True:
+                try:
+                    record, output_handlers = _LOG_QUEUE.get_nowait()
+                except queue.Empty:
+                    break
+                _write_record_now(record, output_handlers)
+                _LOG_QUEUE.task_done()
+
+
+def _flush_log_queue():
+    """Blocks until every record already enqueued has been written."""
+    if _log_dispatcher_started:
+        _LOG_QUEUE.join()
+
+
+def _restart_log_dispatcher_in_child():
+    """
+    Threads do not survive fork(): the child process gets its own queue (the inherited one still
+    references the parent's waiting thread) and starts its own dispatcher thread.
+    """
+    global _LOG_QUEUE, _LOG_DISPATCHER, _LOG_DISPATCHER_LOCK, _log_dispatcher_started
+    _LOG_DISPATCHER_LOCK = threading.Lock()
+    if _log_dispatcher_started:
+        _LOG_QUEUE = queue.Queue(-1)
+        _LOG_DISPATCHER = _LogDispatcher(_LOG_QUEUE)
+        _log_dispatcher_started = False
+        _start_log_dispatcher()
+
+
+def _close_output_handlers(output_handlers: list[logging.Handler]):
+    """Closes the stream and file handlers of a logger (file descriptors are released)."""
+    # Pending records are written first, unless the garbage collector runs this on the dispatcher thread itself
+    if threading.current_thread() is not _LOG_DISPATCHER._thread:
+        _flush_log_queue()
+    for handler in output_handlers:
+        handler.close()
+
+
+atexit.register(_stop_log_dispatcher)
+if hasattr(os, "register_at_fork"):
+    # Drain before forking so the child does not write the parent's pending records a second time
+    os.register_at_fork(before=_flush_log_queue, after_in_child=_restart_log_dispatcher_in_child)
+
+
 class CustomLogger(logging.Logger):
     """
     CustomLogger class extends the logging.Logger to provide enhanced logging functionalities.
@@ -84,6 +238,9 @@ class CustomLogger(logging.Logger):
         self._verbose_logger_type: bool = None
         self.formatter: logging.Formatter = None
         self._file_path = None
+        self._output_handlers: list[logging.Handler] = []
+        # Closes the output handlers when the logger is garbage collected, or at exit, if close() was not called
+        self._finalizer = weakref.finalize(self, _close_output_handlers, self._output_handlers)
 
         self._setup_logging_file_for_output(file_path, f"{name}_{logger_file_name}")
         self.set_logger_type(logger_type)
@@ -103,20 +260,29 @@ class CustomLogger(logging.Logger):
         self._set_logger_from_type()
         self._set_logger_handlers()
 
+    def flush(self):
+        """Blocks until every record already logged has been written by the background thread."""
+        _flush_log_queue()
+
     def close(self):
+        self.flush()
         try:
             with open(self._file_path, "a") as f:
                 f.write(f"{datetime.datetime.now()} :: ------------------ closing logger ------------------ \n")
         except FileNotFoundError:
             pass
-        self.__del__()
-
-    def __del__(self):
-        for i in self.handlers:
+        self._finalizer()
+        for i in list(self.handlers):
             self.removeHandler(i)
-        for i in self.filters:
+        for i in list(self.filters):
             self.removeFilter(i)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _setup_logging_file_for_output(self, logging_file_path: str = None, file_name: str = None):
         """
         Sets up a logging file for output by preparing the necessary file path. It ensures
@@ -141,15 +307,25 @@ class CustomLogger(logging.Logger):
         self._file_path = os.path.join(output_path, file_name)
 
     def _set_logger_handlers(self):
-        """Sets up the logger's handlers.'"""
+        """
+        Sets up the logger's handlers. The stream and file handlers are listed in `handlers` but written to
+        by the background log dispatcher, through the logger's queue handler (see callHandlers).
+        """
+        # The filter runs once per record on the logger rather than once per output handler
+        self.addFilter(self._filter_logs)
+
         handler = logging.StreamHandler()
         handler.setFormatter(self.formatter)
-        handler.addFilter(self._filter_logs)
+        self._output_handlers.append(handler)
         self.addHandler(handler)
 
         if self._file_path:
             self._add_file_handler(self._file_path)
 
+        if not any(isinstance(i, _LoggerQueueHandler) for i in self.handlers):
+            self.addHandler(_LoggerQueueHandler(self._output_handlers))
+        _start_log_dispatcher()
+
     def _set_logger_from_type(self):
         """Sets the logger's level and formatter based on the logger type.'"""
         logger_params = _LOGGER_TYPE[self._logger_type]
@@ -169,12 +345,15 @@ class CustomLogger(logging.Logger):
 
     def _add_file_handler(self, file_path: str):
         """Adds a file handler to save logs to the specified file."""
-        file_handler = logging.FileHandler(file_path)
+        file_handler = _BufferedFileHandler(file_path)
         file_handler.setFormatter(self.formatter)
+        self._output_handlers.append(file_handler)
         self.addHandler(file_handler)
-        file_handler.addFilter(self._filter_logs)
 
     def progress(self, msg: str, exc_info=None, stack_info=False, stacklevel=10, extra=None, *args, **kwargs):
+        # Same outcome as _filter_logs, decided before the record (and its caller lookup) is built
+        if msg is not None and not self._verbose_logger_type:
+            return
         self.log(
             level=PROGRESS_LEVELV_NUM,
             msg=msg,
@@ -186,5 +365,31 @@ class CustomLogger(logging.Logger):
             **kwargs,
         )
 
+    def removeHandler(self, hdlr: logging.Handler):
+        """Removes the handler, and stops the log dispatcher from writing to it if it is a stream or file handler."""
+        super().removeHandler(hdlr)
+        if hdlr in self._output_handlers:
+            self._output_handlers.remove(hdlr)
+
+    def callHandlers(self, record: logging.LogRecord):
+        """
+        Same as logging.Logger.callHandlers, except that the stream and file handlers listed in `handlers`
+        are not called on the logging thread: the queue handler hands the record to the log dispatcher.
+        """
+        found = 0
+        logger = self
+        while logger:
+            for handler in logger.handlers:
+                found += 1
+                if logger is self and handler in self._output_handlers:
+                    continue
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        if found == 0 and logging.lastResort and record.levelno >= logging.lastResort.level:
+            logging.lastResort.handle(record)
+
     def log(self, level, msg, exc_info=None, stack_info=False, stacklevel=10, extra=None, *args, **kwargs):
         super().log(level, msg, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra, *args)
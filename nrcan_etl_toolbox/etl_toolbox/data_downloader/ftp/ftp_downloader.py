@@ -1,8 +1,14 @@
+import copy
 import ftplib
+import hashlib
 import os
 import pathlib
+import queue
 import stat as stat_module
+import threading
+import zlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -23,6 +29,14 @@ class FTP_SERVER_TYPE(Enum):
 
 ftp_logger = CustomLogger("FTPDownloader")
 
+# Connexions SSH partagées entre les SFTPDownloader créés avec reuse_connection=True,
+# par (hôte, port, utilisateur, fichier de clé, empreinte du mot de passe)
+_SSH_CLIENT_POOL: dict[tuple, paramiko.SSHClient] = {}
+_SSH_CLIENT_POOL_LOCK = threading.Lock()
+
+# Taille des blocs lus sur le réseau et du tampon d'écriture local (1 Mio)
+_TRANSFER_BLOCK_SIZE = 1 << 20
+
 
 @dataclass
 class FTPServerConfig:
@@ -35,11 +49,36 @@ class FTPServerConfig:
     ftp_key_file_path: Optional[str] = None
     ftp_port: Optional[int] = None
     ftp_timeout: Optional[int] = None
+    ftp_max_workers: int | None = None
+    ftp_reuse_connection: bool = False
+
+
+def _drop_page_cache(local_file):
+    """Écrit le fichier sur le disque puis retire ses pages du cache du noyau (POSIX uniquement)"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    local_file.flush()
+    os.fdatasync(local_file.fileno())
+    os.posix_fadvise(local_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _log_skipped_files(skipped, file_filter, max_names=20):
+    """Un seul message pour les fichiers d'un dossier ignorés par le filtre (liste des noms tronquée)"""
+    if skipped:
+        ftp_logger.info(
+            "%s files skipped (filter %r): %s%s",
+            len(skipped),
+            file_filter,
+            ", ".join(skipped[:max_names]),
+            ", ..." if len(skipped) > max_names else "",
+        )
 
 
 class BaseDownloader(ABC):
     """Abstract class for downloaders"""
 
+    max_workers = 1
+
     @abstractmethod
     def directory_exists(self, directory_path):
         pass
@@ -64,30 +103,91 @@ class BaseDownloader(ABC):
     def disconnect(self):
         pass
 
+    def _open_worker(self) -> Optional["BaseDownloader"]:
+        """Ouvre une connexion supplémentaire pour un téléchargement parallèle (None si non supporté ou refusé)"""
+        return None
+
+    def _close_worker(self, worker: "BaseDownloader"):
+        """Ferme une connexion ouverte par _open_worker"""
+        worker.disconnect()
+
+    def _download_all(self, downloads):
+        """
+        Télécharge les couples (fichier distant, chemin local) et retourne le nombre de succès.
+        Avec max_workers > 1, les fichiers sont répartis sur plusieurs connexions utilisées en parallèle ;
+        si le serveur en refuse une partie (limite de sessions), seules les connexions ouvertes sont utilisées.
+        """
+        worker_count = min(self.max_workers, len(downloads))
+        workers = queue.Queue()
+
+        def download(remote_file_and_local_path):
+            worker = workers.get()
+            try:
+                return worker.download_file(*remote_file_and_local_path)
+            finally:
+                workers.put(worker)
+
+        try:
+            for _ in range(worker_count if worker_count > 1 else 0):
+                worker = self._open_worker()
+                if worker is None:
+                    break
+                workers.put(worker)
+
+            opened_count = workers.qsize()
+            if opened_count == 0:
+                return sum(1 for remote_file, local_path in downloads if self.download_file(remote_file, local_path))
+            if opened_count < worker_count:
+                ftp_logger.info("%s/%s parallel connections opened", opened_count, worker_count)
+
+            with ThreadPoolExecutor(max_workers=opened_count) as executor:
+                return sum(1 for downloaded in executor.map(download, downloads) if downloaded)
+        finally:
+            while not workers.empty():
+                self._close_worker(workers.get_nowait())
+
 
 class FTPDownloader(BaseDownloader):
-    def __init__(self, host, username=None, password=None, port=21):
+    def __init__(
+        self, host, username=None, password=None, port=21, max_workers=1, compress=False, drop_page_cache=False
+    ):
         self.host = host
         self.username = username
         self.password = password
         self.port = port
+        # Chaque worker ouvre sa propre session FTP (login compris) : 1 par défaut pour ménager les serveurs
+        self.max_workers = max_workers
+        # Utilise le mode de transfert compressé (MODE Z) pour les fichiers ; ignoré si le serveur le refuse
+        self.compress = compress
+        # Libère le cache de pages de chaque fichier téléchargé (gros jeux de données qui ne seront pas relus)
+        self.drop_page_cache = drop_page_cache
+        self._mode_z = False
+        # Mode de transfert courant de la session ("S" : flux non compressé, "Z" : flux compressé zlib)
+        self._transfer_mode = "S"
         self.ftp = None
+        # Résultats de directory_exists pour la connexion courante (vidé à la connexion/déconnexion)
+        self._directory_cache: dict[str, bool] = {}
 
     def directory_exists(self, directory_path):
         """Teste si un dossier existe sur le serveur FTP"""
         if not self.ftp:
             return False
+        if directory_path in self._directory_cache:
+            return self._directory_cache[directory_path]
 
         try:
             current_dir = self.ftp.pwd()
             self.ftp.cwd(directory_path)
             self.ftp.cwd(current_dir)  # Retour au dossier précédent
-            return True
+            is_directory = True
         except ftplib.all_errors:
-            return False
+            is_directory = False
+        self._directory_cache[directory_path] = is_directory
+        return is_directory
 
     def connect(self):
         """Establish the connection to the FTP server"""
+        self._directory_cache.clear()
         try:
             self.ftp = ftplib.FTP()
             self.ftp.connect(self.host, self.port)
@@ -97,12 +197,33 @@ class FTPDownloader(BaseDownloader):
             else:
                 self.ftp.login()  # Anonymous connection
 
-            ftp_logger.info(f"FTP connection successful to {self.host}")
+            self._transfer_mode = "S"
+            self._mode_z = self.compress and self._enable_mode_z()
+            ftp_logger.info("FTP connection successful to %s", self.host)
             return True
         except ftplib.all_errors as e:
-            ftp_logger.info(f"FTP connection error: {e}")
+            ftp_logger.info("FTP connection error: %s", e)
             return False
 
+    def _enable_mode_z(self):
+        """Active le transfert compressé zlib (MODE Z) ; retourne False si le serveur ne le supporte pas"""
+        try:
+            self.ftp.voidcmd("MODE Z")
+            self._transfer_mode = "Z"
+            return True
+        except ftplib.all_errors as e:
+            ftp_logger.info("FTP server does not support MODE Z: %s", e)
+            return False
+
+    def _set_transfer_mode(self, mode):
+        """
+        Envoie MODE S ou MODE Z si la session est dans l'autre mode. Seuls les RETR passent en MODE Z :
+        les listes (NLST, MLSD) sont lues en texte par ftplib et doivent rester non compressées.
+        """
+        if self._transfer_mode != mode:
+            self.ftp.voidcmd(f"MODE {mode}")
+            self._transfer_mode = mode
+
     def list_files(self, directory="/"):
         """List files in a directory"""
         if not self.ftp:
@@ -110,10 +231,11 @@ class FTPDownloader(BaseDownloader):
 
         try:
             self.ftp.cwd(directory)
+            self._set_transfer_mode("S")
             files = self.ftp.nlst()
             return files
         except ftplib.all_errors as e:
-            ftp_logger.error(f"Error during listing: {e}")
+            ftp_logger.error("Error during listing: %s", e)
             return []
 
     def download_file(self, remote_file, local_path, file_filter=None):
@@ -128,119 +250,209 @@ class FTPDownloader(BaseDownloader):
                 local_dir = pathlib.Path(local_path) / remote_folder_name
                 local_dir.mkdir(parents=True, exist_ok=True)
 
-                self._download_directory_recursive_ftp(remote_file, local_dir, file_filter)
-                ftp_logger.info(f"FTP directory downloaded: {remote_file} -> {local_dir}")
+                skipped = []
+                self._download_directory_recursive_ftp(remote_file, local_dir, file_filter, skipped)
+                _log_skipped_files(skipped, file_filter)
+                ftp_logger.info("FTP directory downloaded: %s -> %s", remote_file, local_dir)
                 return True
             else:
                 # Pour un fichier unique, vérifier le filtre
                 if file_filter and file_filter not in remote_file:
-                    ftp_logger.info(f"File skipped (filter): {remote_file}")
+                    ftp_logger.info("File skipped (filter): %s", remote_file)
                     return True
 
                 local_file_path = pathlib.Path(local_path)
                 local_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-                with open(local_file_path, "wb") as local_file:
-                    self.ftp.retrbinary(f"RETR {remote_file}", local_file.write)
+                self._retrieve_file(remote_file, local_file_path)
 
-                ftp_logger.info(f"FTP file downloaded: {remote_file} -> {local_path}")
+                ftp_logger.info("FTP file downloaded: %s -> %s", remote_file, local_path)
                 return True
         except ftplib.all_errors as e:
-            ftp_logger.error(f"FTP download error: {e}")
+            ftp_logger.error("FTP download error: %s", e)
             return False
 
-    def _download_directory_recursive_ftp(self, remote_dir, local_dir, file_filter=None):
+    def _retrieve_file(self, remote_file, local_file_path):
+        """Télécharge un fichier distant FTP par blocs de _TRANSFER_BLOCK_SIZE"""
+        with open(local_file_path, "wb", buffering=_TRANSFER_BLOCK_SIZE) as local_file:
+            if self._mode_z:
+                # En MODE Z, le flux de données est compressé : décompression au fil de la réception
+                self._set_transfer_mode("Z")
+                decompressor = zlib.decompressobj()
+                self.ftp.retrbinary(
+                    f"RETR {remote_file}",
+                    lambda block: local_file.write(decompressor.decompress(block)),
+                    blocksize=_TRANSFER_BLOCK_SIZE,
+                )
+                local_file.write(decompressor.flush())
+            else:
+                self.ftp.retrbinary(f"RETR {remote_file}", local_file.write, blocksize=_TRANSFER_BLOCK_SIZE)
+
+            if self.drop_page_cache:
+                _drop_page_cache(local_file)
+
+    def _list_directory_entries(self, remote_dir):
+        """
+        Liste un dossier distant FTP en une seule commande MLSD : retourne les couples (chemin, est_un_dossier).
+        Sans MLSD (ou pour les liens), le type est obtenu avec directory_exists, un aller-retour par entrée.
+        """
+        self._set_transfer_mode("S")
+        try:
+            listing = list(self.ftp.mlsd(remote_dir, facts=["type"]))
+        except ftplib.error_perm:
+            # Serveur sans support MLSD
+            return [(file_path, self.directory_exists(file_path)) for file_path in self.ftp.nlst(remote_dir)]
+
+        entries = []
+        for name, facts in listing:
+            entry_type = facts.get("type", "").lower()
+            if entry_type in ("cdir", "pdir"):
+                continue
+            file_path = f"{remote_dir.rstrip('/')}/{name}"
+            if entry_type in ("dir", "file"):
+                self._directory_cache[file_path] = entry_type == "dir"
+            entries.append((file_path, self.directory_exists(file_path)))
+        return entries
+
+    def _download_directory_recursive_ftp(self, remote_dir, local_dir, file_filter=None, skipped=None):
         """Télécharge récursivement un dossier distant FTP avec filtre"""
         try:
-            files = self.ftp.nlst(remote_dir)
-            for file_path in files:
-                filename = os.path.basename(file_path)
-                local_file_path = local_dir / filename
-
-                if self.directory_exists(file_path):
-                    local_file_path.mkdir(exist_ok=True)
-                    self._download_directory_recursive_ftp(file_path, local_file_path, file_filter)
+            # Chemins locaux construits en chaînes : pas d'objet Path par entrée
+            local_dir = os.fspath(local_dir)
+            for file_path, is_directory in self._list_directory_entries(remote_dir):
+                filename = file_path.rpartition("/")[2]
+                local_file_path = f"{local_dir}/{filename}"
+
+                if is_directory:
+                    os.makedirs(local_file_path, exist_ok=True)
+                    self._download_directory_recursive_ftp(file_path, local_file_path, file_filter, skipped)
                 else:
                     # Appliquer le filtre
                     if file_filter is None or file_filter in filename:
-                        with open(local_file_path, "wb") as local_file:
-                            self.ftp.retrbinary(f"RETR {file_path}", local_file.write)
-                    else:
-                        ftp_logger.info(f"File skipped (filter): {filename}")
+                        self._retrieve_file(file_path, local_file_path)
+                    elif skipped is not None:
+                        skipped.append(filename)
         except ftplib.all_errors as e:
-            ftp_logger.error(f"Error downloading directory {remote_dir}: {e}")
+            ftp_logger.error("Error downloading directory %s: %s", remote_dir, e)
 
     def download_multiple_files(self, file_list, local_directory):
         """Download multiple files"""
-        success_count = 0
-        for remote_file in file_list:
-            filename = os.path.basename(remote_file)
-            local_path = os.path.join(local_directory, filename)
-            if self.download_file(remote_file, local_path):
-                success_count += 1
-        ftp_logger.info(f"{success_count}/{len(file_list)} FTP files downloaded")
+        local_directory = os.fspath(local_directory)
+        downloads = [(remote_file, f"{local_directory}/{remote_file.rpartition('/')[2]}") for remote_file in file_list]
+        success_count = self._download_all(downloads)
+        ftp_logger.info("%s/%s FTP files downloaded", success_count, len(file_list))
         return success_count
 
+    def _open_worker(self):
+        """Ouvre une nouvelle session FTP avec les mêmes paramètres de connexion"""
+        if not self.ftp:
+            return None
+        worker = copy.copy(self)
+        worker.ftp = None
+        worker._directory_cache = {}
+        if not worker.connect():
+            worker.ftp.close()
+            return None
+        return worker
+
     def disconnect(self):
         """Close the FTP connection"""
+        self._directory_cache.clear()
         if self.ftp:
             self.ftp.quit()
             ftp_logger.info("FTP connection closed")
 
 
 class SFTPDownloader(BaseDownloader):
-    def __init__(self, host, username, key_file_path=None, password=None, port=22):
+    def __init__(
+        self, host, username, key_file_path=None, password=None, port=22, max_workers=1, reuse_connection=False
+    ):
         self.host = host
         self.username = username
         self.key_file_path = key_file_path
         self.password = password
         self.port = port
+        # Les workers ouvrent des canaux SFTP sur la connexion SSH existante (pas de nouvelle authentification) :
+        # 1 par défaut, comme pour FTP, les serveurs limitant souvent le nombre de sessions par connexion
+        self.max_workers = max_workers
+        # Réutilise une connexion SSH déjà authentifiée (pool du module) : seul un canal SFTP est ouvert
+        self.reuse_connection = reuse_connection
         self.ssh_client = None
         self.sftp_client = None
+        # Résultats de directory_exists pour la connexion courante (vidé à la connexion/déconnexion)
+        self._directory_cache: dict[str, bool] = {}
 
     def directory_exists(self, directory_path):
         """Teste si un dossier existe sur le serveur SFTP"""
         if not self.sftp_client:
             return False
+        if directory_path in self._directory_cache:
+            return self._directory_cache[directory_path]
 
         try:
             stat = self.sftp_client.stat(directory_path)
-            return stat_module.S_ISDIR(stat.st_mode)
+            is_directory = stat_module.S_ISDIR(stat.st_mode)
         except Exception:
-            return False
+            is_directory = False
+        self._directory_cache[directory_path] = is_directory
+        return is_directory
 
     def connect(self):
         """Establish the connection to the SFTP server"""
+        self._directory_cache.clear()
         try:
-            self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-            if self.key_file_path:
-                # Key-based authentication
-                private_key = paramiko.RSAKey.from_private_key_file(self.key_file_path)
-                self.ssh_client.connect(
-                    hostname=self.host,
-                    port=self.port,
-                    username=self.username,
-                    pkey=private_key,
-                )
+            if self.reuse_connection:
+                self.ssh_client = self._get_pooled_ssh_client()
             else:
-                # Password authentication
-                self.ssh_client.connect(
-                    hostname=self.host,
-                    port=self.port,
-                    username=self.username,
-                    password=self.password,
-                )
+                self.ssh_client = self._open_ssh_client()
 
             self.sftp_client = self.ssh_client.open_sftp()
-            ftp_logger.info(f"SFTP connection successful to {self.host}")
+            ftp_logger.info("SFTP connection successful to %s", self.host)
             return True
 
         except Exception as e:
-            ftp_logger.error(f"SFTP connection error: {e}")
+            ftp_logger.error("SFTP connection error: %s", e)
             return False
 
+    def _open_ssh_client(self):
+        """Ouvre et authentifie une nouvelle connexion SSH"""
+        ssh_client = paramiko.SSHClient()
+        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        if self.key_file_path:
+            # Key-based authentication
+            private_key = paramiko.RSAKey.from_private_key_file(self.key_file_path)
+            ssh_client.connect(
+                hostname=self.host,
+                port=self.port,
+                username=self.username,
+                pkey=private_key,
+            )
+        else:
+            # Password authentication
+            ssh_client.connect(
+                hostname=self.host,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+            )
+        return ssh_client
+
+    def _get_pooled_ssh_client(self):
+        """
+        Retourne la connexion SSH du pool ouverte avec les mêmes identifiants, ouverte au besoin. La clé du pool
+        inclut le fichier de clé et une empreinte du mot de passe : un downloader aux identifiants différents
+        s'authentifie sur sa propre connexion au lieu de recevoir une connexion déjà authentifiée.
+        """
+        password_digest = hashlib.sha256(self.password.encode()).hexdigest() if self.password else None
+        key = (self.host, self.port, self.username, self.key_file_path, password_digest)
+        with _SSH_CLIENT_POOL_LOCK:
+            ssh_client = _SSH_CLIENT_POOL.get(key)
+            transport = ssh_client.get_transport() if ssh_client else None
+            if transport is None or not transport.is_active():
+                ssh_client = _SSH_CLIENT_POOL[key] = self._open_ssh_client()
+            return ssh_client
+
     def list_files(self, directory="/"):
         """List files in a directory"""
         if not self.sftp_client:
@@ -249,7 +461,7 @@ class SFTPDownloader(BaseDownloader):
             files = self.sftp_client.listdir(directory)
             return files
         except Exception as e:
-            ftp_logger.error(f"SFTP listing error: {e}")
+            ftp_logger.error("SFTP listing error: %s", e)
             return []
 
     def download_file(self, remote_file, local_path, file_filter=None):
@@ -265,66 +477,95 @@ class SFTPDownloader(BaseDownloader):
 
                 # Create local directory if it doesn't exist
                 local_dir.mkdir(parents=True, exist_ok=True)
-                self._download_directory_recursive(remote_file, local_dir, file_filter)
-                ftp_logger.info(f"SFTP directory downloaded: {remote_file} -> {local_dir}")
+                skipped = []
+                self._download_directory_recursive(remote_file, local_dir, file_filter, skipped)
+                _log_skipped_files(skipped, file_filter)
+                ftp_logger.info("SFTP directory downloaded: %s -> %s", remote_file, local_dir)
                 return True
             else:
                 # For a single file, check the filter
                 if file_filter and file_filter not in remote_file:
-                    ftp_logger.info(f"File skipped (filter): {remote_file}")
+                    ftp_logger.info("File skipped (filter): %s", remote_file)
                     return True
 
                 local_file_path = pathlib.Path(local_path)
                 local_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-                self.sftp_client.get(remote_file, str(local_file_path))
-                ftp_logger.info(f"SFTP file downloaded: {remote_file} -> {local_path}")
+                self._retrieve_file(remote_file, local_file_path)
+                ftp_logger.info("SFTP file downloaded: %s -> %s", remote_file, local_path)
                 return True
 
         except Exception as e:
-            ftp_logger.error(f"SFTP download error: {e}")
+            ftp_logger.error("SFTP download error: %s", e)
             return False
 
-    def _download_directory_recursive(self, remote_dir, local_dir, file_filter=None):
+    def _retrieve_file(self, remote_file, local_file_path):
+        """Télécharge un fichier distant SFTP (lectures anticipées) avec un grand tampon d'écriture local"""
+        with open(local_file_path, "wb", buffering=_TRANSFER_BLOCK_SIZE) as local_file:
+            self.sftp_client.getfo(remote_file, local_file, prefetch=True)
+
+    def _download_directory_recursive(self, remote_dir, local_dir, file_filter=None, skipped=None):
         """Télécharge récursivement un dossier distant avec filtre"""
         try:
-            files = self.sftp_client.listdir(remote_dir)
-            for file in files:
+            # Chemins locaux construits en chaînes : pas d'objet Path par entrée
+            local_dir = os.fspath(local_dir)
+            # listdir_attr donne le type de chaque entrée dans la même requête que la liste
+            for file_attributes in self.sftp_client.listdir_attr(remote_dir):
+                file = file_attributes.filename
                 remote_file_path = f"{remote_dir}/{file}"
-                local_file_path = local_dir / file
+                local_file_path = f"{local_dir}/{file}"
+
+                # Les liens sont résolus par directory_exists (stat), comme auparavant
+                if file_attributes.st_mode is not None and not stat_module.S_ISLNK(file_attributes.st_mode):
+                    self._directory_cache[remote_file_path] = stat_module.S_ISDIR(file_attributes.st_mode)
 
                 if self.directory_exists(remote_file_path):
-                    local_file_path.mkdir(exist_ok=True)
-                    self._download_directory_recursive(remote_file_path, local_file_path, file_filter)
+                    os.makedirs(local_file_path, exist_ok=True)
+                    self._download_directory_recursive(remote_file_path, local_file_path, file_filter, skipped)
                 else:
                     # Check if the file matches the filter
                     if file_filter is None or file_filter in file:
-                        self.sftp_client.get(remote_file_path, str(local_file_path))
-                    else:
-                        ftp_logger.info(f"File skipped (filter): {file}")
+                        self._retrieve_file(remote_file_path, local_file_path)
+                    elif skipped is not None:
+                        skipped.append(file)
 
         except Exception as e:
-            ftp_logger.error(f"Error downloading directory {remote_dir}: {e}")
+            ftp_logger.error("Error downloading directory %s: %s", remote_dir, e)
 
     def download_multiple_files(self, file_list, local_directory):
         """Download multiple files"""
-        success_count = 0
         Path(local_directory).mkdir(parents=True, exist_ok=True)
 
-        for remote_file in file_list:
-            filename = os.path.basename(remote_file)
-            local_path = os.path.join(local_directory, filename)
-            if self.download_file(remote_file, local_path):
-                success_count += 1
-
-        ftp_logger.info(f"{success_count}/{len(file_list)} SFTP files downloaded")
+        local_directory = os.fspath(local_directory)
+        downloads = [(remote_file, f"{local_directory}/{remote_file.rpartition('/')[2]}") for remote_file in file_list]
+        success_count = self._download_all(downloads)
+        ftp_logger.info("%s/%s SFTP files downloaded", success_count, len(file_list))
         return success_count
 
+    def _open_worker(self):
+        """Ouvre un canal SFTP supplémentaire sur la connexion SSH courante"""
+        if not self.sftp_client:
+            return None
+        worker = copy.copy(self)
+        try:
+            worker.sftp_client = self.ssh_client.open_sftp()
+        except Exception as e:
+            ftp_logger.info("Additional SFTP channel refused: %s", e)
+            return None
+        worker._directory_cache = {}
+        return worker
+
+    def _close_worker(self, worker):
+        """Ferme le canal SFTP du worker sans fermer la connexion SSH partagée"""
+        worker.sftp_client.close()
+
     def disconnect(self):
         """Close the SFTP connection"""
+        self._directory_cache.clear()
         if self.sftp_client:
             self.sftp_client.close()
-        if self.ssh_client:
+        # Une connexion du pool reste ouverte pour les autres downloaders (voir DownloaderFactory.close_pool)
+        if self.ssh_client and not self.reuse_connection:
             self.ssh_client.close()
         ftp_logger.info("SFTP connection closed")
 
@@ -340,6 +581,8 @@ class DownloaderFactory:
         password=None,
         key_file_path=None,
         port=None,
+        max_workers=None,
+        reuse_connection=False,
     ):
         """
         Create the right downloader according to server type
@@ -351,17 +594,28 @@ class DownloaderFactory:
             password: password (optional for FTP, required for SFTP without key)
             key_file_path: path to key file (for SFTP)
             port: connection port (21 for FTP, 22 for SFTP by default)
+            max_workers: parallel connections used by download_multiple_files (1 by default: sequential)
+            reuse_connection: share one SSH connection per host, port and credentials between SFTP downloaders
+                (ignored for FTP), until close_pool() is called
         """
         match server_type:
             case FTP_SERVER_TYPE.FTP:
                 port = port or 21
-                return FTPDownloader(host, username, password, port)
+                return FTPDownloader(host, username, password, port, max_workers or 1)
             case FTP_SERVER_TYPE.SFTP:
                 port = port or 22
-                return SFTPDownloader(host, username, key_file_path, password, port)
+                return SFTPDownloader(host, username, key_file_path, password, port, max_workers or 1, reuse_connection)
             case _:
                 raise ValueError(f"Unsupported server type: {server_type}")
 
+    @staticmethod
+    def close_pool():
+        """Close the SSH connections shared by the SFTP downloaders created with reuse_connection=True"""
+        with _SSH_CLIENT_POOL_LOCK:
+            for ssh_client in _SSH_CLIENT_POOL.values():
+                ssh_client.close()
+            _SSH_CLIENT_POOL.clear()
+
     @staticmethod
     def create_from_config(config: DictConfig | dict) -> BaseDownloader:
         """
@@ -373,6 +627,8 @@ class DownloaderFactory:
             - ftp_password: password (optional for FTP, required for SFTP without key)
             - ftp_key_file_path: path to key file (for SFTP)
             - ftp_port: connection port (21 for FTP, 22 for SFTP by default)
+            - ftp_max_workers: parallel connections for download_multiple_files (1 by default)
+            - ftp_reuse_connection: share the SSH connection between SFTP downloaders (False by default)
         If using Hydra, the configuration should be structured as follows:
         server:
             ftp_protocol: 'ftp'  # or 'sftp'
@@ -381,6 +637,8 @@ class DownloaderFactory:
             ftp_password: 'pass'  # optional for FTP, required for SFTP without key
             ftp_key_file_path: '/path/to/key.pem'  # required for SFTP if not using password
             ftp_port: 21  # optional, defaults to 21 for FTP and 22 for SFTP
+            ftp_max_workers: 4  # optional, defaults to 1 (sequential downloads)
+            ftp_reuse_connection: false  # optional, SFTP only
 
         Args:
             config: Hydra configuration object or a dictionary containing the FTP server configuration.
@@ -407,4 +665,6 @@ class DownloaderFactory:
             password=server_config.ftp_password,
             key_file_path=server_config.ftp_key_file_path,
             port=server_config.ftp_port,
+            max_workers=server_config.ftp_max_workers,
+            reuse_connection=server_config.ftp_reuse_connection,
         )
@@ -1,18 +1,50 @@
-import os
 import pathlib
+import sys
+from typing import TYPE_CHECKING
 
 import pandas as pd
-from sqlalchemy import Connection, Engine
-from sqlalchemy.orm import Session
 
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers import (
-    ExcelReader,
-    CSVReader,
-    JSONReader,
-    ShapefileReader,
-    PostGisTableDataReader,
-    GeoPackageDataReader,
-    MicrosoftAccessDatabaseReader)
+from nrcan_etl_toolbox.etl_toolbox.reader import source_readers
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection, Engine
+    from sqlalchemy.orm import Session
+
+    from nrcan_etl_toolbox.etl_toolbox.reader.source_readers import BaseDataReader
+
+
+# Reader class name for each supported file extension
+_EXTENSION_READERS = {
+    ".xlsx": "ExcelReader",
+    ".xls": "ExcelReader",
+    ".gpkg": "GeoPackageDataReader",
+    ".csv": "CSVReader",
+    ".json": "JSONReader",
+    ".shp": "ShapefileReader",
+    ".mdb": "MicrosoftAccessDatabaseReader",
+    ".accdb": "MicrosoftAccessDatabaseReader",
+}
+
+
+def __getattr__(name):
+    # Reader classes are resolved on first use (see source_readers), module attributes can still be patched
+    if name in source_readers._READER_MODULES:
+        return getattr(source_readers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _reader_class(name: str) -> type:
+    return getattr(sys.modules[__name__], name)
+
+
+def _is_sqlalchemy_source(input_source) -> bool:
+    # A SQLAlchemy object cannot exist before SQLAlchemy is imported: no need to import it for the check
+    if "sqlalchemy" not in sys.modules:
+        return False
+    from sqlalchemy import Connection, Engine
+    from sqlalchemy.orm import Session
+
+    return isinstance(input_source, (Engine, Session, Connection))
 
 
 class ReaderFactory:
@@ -23,7 +55,7 @@ class ReaderFactory:
 
     def __init__(
             self,
-            input_source: str | Engine | Session | Connection | pathlib.Path = None,
+            input_source: "str | Engine | Session | Connection | pathlib.Path" = None,
             schema=None,
             table_name=None,
             **kwargs: dict[str, str] | None,
@@ -69,24 +101,13 @@ class ReaderFactory:
             A reader object corresponding to the detected data source type.
         """
         # Check for SQLAlchemy-based sources
-        if isinstance(input_source, (Engine, Session, Connection)):
+        if _is_sqlalchemy_source(input_source):
             # Parameters (e.g., schema, table_name, etc.) can be passed via **kwargs
-            return PostGisTableDataReader(input_source, schema=schema, table_name=table_name, **kwargs)
+            return _reader_class("PostGisTableDataReader")(input_source, schema=schema, table_name=table_name, **kwargs)
 
         # Handle file-based sources by extension
-        _, extension = os.path.splitext(str(input_source).lower())
-        match extension:
-            case ".xlsx" | ".xls":
-                return ExcelReader(input_source, **kwargs)
-            case ".gpkg":
-                return GeoPackageDataReader(input_source, **kwargs)
-            case ".csv":
-                return CSVReader(input_source, **kwargs)
-            case ".json":
-                return JSONReader(input_source, **kwargs)
-            case ".shp":
-                return ShapefileReader(input_source, **kwargs)
-            case ".mdb" | ".accdb":
-                return MicrosoftAccessDatabaseReader(input_source, **kwargs)
-            case _:
-                raise ValueError(f"Type de fichier non pris en charge ou source invalide : {extension}")
+        extension = pathlib.PurePath(str(input_source)).suffix.lower()
+        reader_name = _EXTENSION_READERS.get(extension)
+        if reader_name is None:
+            raise ValueError(f"Type de fichier non pris en charge ou source invalide : {extension}")
+        return _reader_class(reader_name)(input_source, **kwargs)
@@ -1,11 +1,18 @@
+import importlib
+
 from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.base_reader import BaseDataReader
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.csv_reader import CSVReader
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.excel_reader import ExcelReader
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.geopackage_reader import GeoPackageDataReader
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.json_reader import JSONReader
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.postgis_reader import PostGisTableDataReader
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.shapefile_reader import ShapefileReader
-from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.access_db_reader import MicrosoftAccessDatabaseReader
+
+# Readers are imported on first access: geopandas/SQLAlchemy are only loaded by the readers that need them
+_READER_MODULES = {
+    "CSVReader": "csv_reader",
+    "ExcelReader": "excel_reader",
+    "GeoPackageDataReader": "geopackage_reader",
+    "JSONReader": "json_reader",
+    "PostGisTableDataReader": "postgis_reader",
+    "ShapefileReader": "shapefile_reader",
+    "MicrosoftAccessDatabaseReader": "access_db_reader",
+}
+
 __all__ = [
     "BaseDataReader",
     "CSVReader",
@@ -16,3 +23,15 @@ __all__ = [
     "ShapefileReader",
     "MicrosoftAccessDatabaseReader"
 ]
+
+
+def __getattr__(name):
+    if name not in _READER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    reader_class = getattr(importlib.import_module(f"{__name__}.{_READER_MODULES[name]}"), name)
+    globals()[name] = reader_class
+    return reader_class
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_READER_MODULES))
@@ -1,4 +1,5 @@
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pandas as pd
@@ -62,6 +63,7 @@ class MicrosoftAccessDatabaseReader(BaseDataReader):
     def _read_data_from_query_parameters(self, table_name: str | None,
                                          where_query: str | None,
                                          limit: int | None,
+                                         con=None,
                                             **kwargs
                                          ) -> pd.DataFrame:
         query = f'SELECT * FROM "{table_name}"'
@@ -70,7 +72,7 @@ class MicrosoftAccessDatabaseReader(BaseDataReader):
             query += f" WHERE {where_query}"
         if limit is not None:
             query += f" LIMIT {limit}"
-        return pd.read_sql(query, self._engine, **kwargs)
+        return pd.read_sql(query, self._engine if con is None else con, **kwargs)
 
     @property
     def columns(self) -> list:
@@ -84,11 +86,31 @@ class MicrosoftAccessDatabaseReader(BaseDataReader):
             case _:
                 return [{i: list(self.read_table(i).columns)} for i in self.get_list_of_tables]
 
-    def read_all_database(self, cols_to_lowercase=True, set_internal_dataframe=False) -> dict[str, pd.DataFrame]:
-        """Reads all tables from the Access database and returns them as a dictionary of DataFrames."""
-        all_tables_data = {}
-        for table_name in self.get_list_of_tables:
-            all_tables_data[table_name] = self.read_table(table_name=table_name, cols_to_lowercase=cols_to_lowercase)
+    def read_all_database(
+            self, cols_to_lowercase=True, set_internal_dataframe=False, max_workers: int = 4
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Reads all tables from the Access database and returns them as a dictionary of DataFrames.
+        Tables are read concurrently by up to `max_workers` threads (pyodbc releases the GIL while the driver
+        fetches rows), each thread reading its share of the tables on a single connection.
+        """
+        def read_tables(table_names):
+            tables_data = {}
+            with self._engine.connect() as connection:
+                for table_name in table_names:
+                    df = self._read_data_from_query_parameters(
+                        table_name=table_name, where_query=None, limit=None, con=connection
+                    )
+                    tables_data[table_name] = self._to_lowercase_columns(df) if cols_to_lowercase else df
+            return tables_data
+
+        table_names = self.get_list_of_tables
+        worker_count = max(1, min(max_workers, len(table_names)))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            read_tables_data = {}
+            for tables_data in executor.map(read_tables, [table_names[i::worker_count] for i in range(worker_count)]):
+                read_tables_data.update(tables_data)
+        all_tables_data = {table_name: read_tables_data[table_name] for table_name in table_names}
         if set_internal_dataframe:
             self._dataframe = all_tables_data
             return self._dataframe
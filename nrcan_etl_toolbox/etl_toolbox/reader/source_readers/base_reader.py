@@ -25,5 +25,7 @@ class BaseDataReader:
 
     @staticmethod
     def _to_lowercase_columns(dataframe: pd.DataFrame = None):
-        dataframe.columns = dataframe.columns.str.lower().str.replace(" ", "_", regex=True)
+        dataframe.columns = [
+            column.lower().replace(" ", "_") if isinstance(column, str) else column for column in dataframe.columns
+        ]
         return dataframe
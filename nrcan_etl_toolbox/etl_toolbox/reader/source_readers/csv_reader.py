@@ -2,10 +2,27 @@ import pandas as pd
 
 from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.base_reader import BaseDataReader
 
+# pandas choisit le moteur par défaut (C, ou python pour skipfooter). Le moteur pyarrow (lecture multi-thread,
+# `pip install nrcan-etl-toolbox[arrow]`) est à demander explicitement : il infère autrement les types et les dates.
+DEFAULT_CSV_ENGINE = None
+
+# Options de pandas.read_csv refusées par le moteur pyarrow : pandas choisit alors le moteur
+_PYARROW_UNSUPPORTED_OPTIONS = frozenset({
+    "skipfooter", "nrows", "converters", "comment", "quoting", "low_memory", "memory_map", "lineterminator",
+    "dayfirst", "iterator", "thousands", "float_precision", "chunksize", "dialect", "skipinitialspace",
+})
+
 
 class CSVReader(BaseDataReader):
     """
     Classe pour lire un fichier CSV et en extraire un DataFrame.
+
+    `engine` est passé à pandas.read_csv() (par défaut, pandas choisit). Avec engine="pyarrow", pandas choisit
+    le moteur lorsqu'une option non supportée par pyarrow est utilisée (skipfooter, nrows, skiprows non entier,
+    délimiteur absent ou de plus d'un caractère, ...).
+
+    Avec `chunksize`, `iter_chunks()` parcourt le fichier par blocs de lignes sans le charger entièrement
+    en mémoire ; la propriété `dataframe` concatène les blocs seulement si elle est utilisée.
     """
 
     def __init__(self, input_source,
@@ -16,6 +33,8 @@ class CSVReader(BaseDataReader):
                  nrows=None,
                  cols_to_lowercase=True,
                  pandas_read_csv_kwargs=None,
+                 engine=DEFAULT_CSV_ENGINE,
+                 chunksize=None,
                  **kwargs):
         super().__init__(input_source)
         if pandas_read_csv_kwargs is None:
@@ -28,15 +47,49 @@ class CSVReader(BaseDataReader):
         self._pandas_read_csv_kwargs = pandas_read_csv_kwargs
         self._kwargs = kwargs
         self._cols_to_lowercase = cols_to_lowercase
+        self._engine = engine
+        self._chunksize = chunksize
 
-    def _read_data(self, **kwargs):
+    def _select_engine(self, read_csv_kwargs: dict):
+        """Retourne le moteur demandé, ou None si pyarrow ne supporte pas une des options de lecture."""
+        if self._engine != "pyarrow":
+            return self._engine
+        if self._skipfooter:
+            return "python"  # seul moteur supportant skipfooter
+        if self._nrows is not None or read_csv_kwargs.keys() & _PYARROW_UNSUPPORTED_OPTIONS:
+            return None
+        # pyarrow n'accepte qu'un nombre de lignes à sauter et un délimiteur d'un seul caractère (ni regex ni détection)
+        if not isinstance(self._skiprows, int) or self._delimiter is None or len(self._delimiter) != 1:
+            return None
+        return "pyarrow"
+
+    def _read_csv(self, **kwargs):
         # Utilise pandas pour lire le fichier CSV
-        self._dataframe = pd.read_csv(self._input_source,
-                                      delimiter=self._delimiter,
-                                      skiprows=self._skiprows,
-                                      skipfooter=self._skipfooter,
-                                      nrows=self._nrows,
-                                      **self._pandas_read_csv_kwargs,
-                                      **self._kwargs, **kwargs)
+        read_csv_kwargs = {**self._pandas_read_csv_kwargs, **self._kwargs, **kwargs}
+        return pd.read_csv(self._input_source,
+                           delimiter=self._delimiter,
+                           skiprows=self._skiprows,
+                           skipfooter=self._skipfooter,
+                           nrows=self._nrows,
+                           engine=self._select_engine(read_csv_kwargs),
+                           **read_csv_kwargs)
+
+    def _read_data(self, **kwargs):
+        if self._chunksize is not None:
+            self._dataframe = pd.concat(list(self.iter_chunks(**kwargs)), ignore_index=True)
+            return
+        self._dataframe = self._read_csv(**kwargs)
         if self._cols_to_lowercase:
             self._dataframe = self._to_lowercase_columns(self._dataframe)
+
+    def iter_chunks(self, chunksize=None, **kwargs):
+        """
+        Itère sur le fichier CSV par DataFrames d'au plus `chunksize` lignes (par défaut celui du constructeur).
+        La mémoire utilisée ne dépend que de la taille d'un bloc, pas de celle du fichier.
+        """
+        chunksize = chunksize or self._chunksize
+        if chunksize is None:
+            raise ValueError("chunksize must be set to read the CSV file by chunks")
+        with self._read_csv(chunksize=chunksize, **kwargs) as chunks:
+            for chunk in chunks:
+                yield self._to_lowercase_columns(chunk) if self._cols_to_lowercase else chunk
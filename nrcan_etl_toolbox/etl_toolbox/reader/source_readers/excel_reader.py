@@ -1,35 +1,88 @@
+import os
+import weakref
+from collections import OrderedDict
+from functools import cached_property
+from importlib.util import find_spec
+
 import pandas as pd
 
 from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.base_reader import BaseDataReader
 
+# The Rust-based calamine engine is used when installed (`pip install nrcan-etl-toolbox[excel]`),
+# otherwise pandas chooses the engine from the file type.
+DEFAULT_EXCEL_ENGINE = "calamine" if find_spec("python_calamine") is not None else None
+
+_SHEET_CACHE_SIZE = 8
+
+# Workbooks opened from a path, shared by the readers of the same unmodified file while one of them is alive.
+_EXCEL_FILE_CACHE: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _excel_file_cache_key(input_source, engine):
+    """(absolute path, modification time, engine) for a path input, None for file-like objects."""
+    if not isinstance(input_source, (str, os.PathLike)):
+        return None
+    try:
+        path = os.path.abspath(input_source)
+        return path, os.path.getmtime(path), engine
+    except OSError:
+        return None
+
 
 class ExcelReader(BaseDataReader):
     """
     Class to read data from Excel files. Input is an Excel file path or an Excel file object.
 
+    The `engine` parameter is passed to pandas.ExcelFile(), defaults to "calamine" when python-calamine
+    is installed and to pandas' own choice otherwise.
+
     Other parameters are passed to pandas.read_excel() function.
     See https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_excel.html for more information
     """
 
-    def __init__(self, input_source, sheet_name=None, skiprows=0, skipfooter=0, **kwargs):
+    def __init__(self, input_source, sheet_name=None, skiprows=0, skipfooter=0, engine=DEFAULT_EXCEL_ENGINE, **kwargs):
         super().__init__(input_source)
+        self._engine = engine
+        self._shares_original_file = False
 
         self.skipfooter = skipfooter
         self.skiprows = skiprows
         self.sheet_name = sheet_name
         self._kwargs = kwargs
-        self._original_file = pd.ExcelFile(
-            self._input_source
-        )  # 20250806 - Removed the `engine` parameter to allow pandas to choose the best engine automatically.
+        # Last sheets read (before column renaming), to avoid parsing a sheet again
+        self._sheet_cache: OrderedDict = OrderedDict()
+
+    @cached_property
+    def _original_file(self) -> pd.ExcelFile:
+        """The workbook is only opened on the first access (sheet names or sheet read)."""
+        # 20250806 - `engine` is None by default to allow pandas to choose the best engine automatically.
+        key = _excel_file_cache_key(self._input_source, self._engine)
+        if key is None:
+            return pd.ExcelFile(self._input_source, engine=self._engine)
+
+        self._shares_original_file = True
+        excel_file = _EXCEL_FILE_CACHE.get(key)
+        if excel_file is None:
+            excel_file = _EXCEL_FILE_CACHE[key] = pd.ExcelFile(self._input_source, engine=self._engine)
+        return excel_file
 
     def __del__(self):
-        if self._original_file is not None:
+        # Only close the workbook if it was opened, a shared one is closed once its last reader is collected
+        if self.__dict__.get("_original_file") is not None and not self._shares_original_file:
             self._original_file.close()
         del self._dataframe
 
+    @cached_property
+    def _sheet_names(self) -> tuple:
+        return tuple(self._original_file.sheet_names)
+
+    @cached_property
+    def _sheet_name_set(self) -> frozenset:
+        return frozenset(self._sheet_names)
+
     @property
     def list_sheet_names(self):
-        return list(self._original_file.sheet_names)
+        return list(self._sheet_names)
 
     def read_sheet(
         self,
@@ -53,7 +106,8 @@ class ExcelReader(BaseDataReader):
         :param sheet_name: The name of the sheet within the Excel file to read.
         :type sheet_name: str
         :param set_internal_dataframe: A flag that indicates whether to update the internal dataframe
-            with the sheet data. Defaults to False.
+            with the sheet data. Defaults to False: the sheet is parsed once and only returned, the
+            `dataframe` property is left untouched.
         :type set_internal_dataframe: bool
         :param skiprows: The number of rows to skip at the beginning when reading the sheet.
             Defaults to 0.
@@ -66,7 +120,7 @@ class ExcelReader(BaseDataReader):
         :rtype: pandas.DataFrame
         :raises ValueError: If the specified sheet_name does not exist in the Excel file.
         """
-        if sheet_name not in self.list_sheet_names:
+        if sheet_name not in self._sheet_name_set:
             raise ValueError(f"Sheet {sheet_name} not found in Excel file.")
         self.sheet_name = sheet_name
         if set_internal_dataframe:
@@ -113,15 +167,38 @@ class ExcelReader(BaseDataReader):
     def __get_pandas_df_from_excel_sheet(
         self, sheet_name=None, skiprows=0, skipfooter=0, cols_to_lowercase=False, **kwargs
     ):
-        df = pd.read_excel(
-            self._original_file, sheet_name=sheet_name, skiprows=skiprows, skipfooter=skipfooter, **kwargs
-        )
+        df = self.__read_excel_sheet(sheet_name, skiprows, skipfooter, **kwargs)
 
         if cols_to_lowercase and sheet_name is not None:
             return self._to_lowercase_columns(df)
         else:
             return df
 
+    def __read_excel_sheet(self, sheet_name, skiprows, skipfooter, **kwargs):
+        """
+        Reads a sheet through an LRU cache of the last _SHEET_CACHE_SIZE sheets read with the same parameters.
+        A copy is returned so callers can modify it. Reads of all sheets or with unhashable parameters are not cached.
+        """
+        try:
+            key = (sheet_name, skiprows, skipfooter, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            key = None
+        if sheet_name is None or key is None:
+            return pd.read_excel(
+                self._original_file, sheet_name=sheet_name, skiprows=skiprows, skipfooter=skipfooter, **kwargs
+            )
+
+        if key in self._sheet_cache:
+            self._sheet_cache.move_to_end(key)
+        else:
+            self._sheet_cache[key] = pd.read_excel(
+                self._original_file, sheet_name=sheet_name, skiprows=skiprows, skipfooter=skipfooter, **kwargs
+            )
+            if len(self._sheet_cache) > _SHEET_CACHE_SIZE:
+                self._sheet_cache.popitem(last=False)
+        return self._sheet_cache[key].copy()
+
     @property
     def columns(self) -> list:
         """Returns a list of column names for the current sheet or
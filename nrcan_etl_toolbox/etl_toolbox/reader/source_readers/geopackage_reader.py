@@ -1,9 +1,13 @@
 import pathlib
+from importlib.util import find_spec
 
 import geopandas as gpd
 
 from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.base_reader import BaseDataReader
 
+# Couche lue en un seul appel GDAL (pyogrio), transférée en colonnes Arrow si pyarrow est installé
+_READ_FILE_OPTIONS = {"engine": "pyogrio", "use_arrow": find_spec("pyarrow") is not None}
+
 
 class GeoPackageDataReader(BaseDataReader):
     def __init__(self, input_source, encoding="utf-8", layer=None):
@@ -20,7 +24,7 @@ class GeoPackageDataReader(BaseDataReader):
             raise ValueError(f"Layer '{layer}' not found in the GeoPackage. Available layers: {self.layers}")
         if len(self.layers) == 0:
             raise ValueError(f"GeoPackage {self._input_source} has no feature layers to read.")
-        self._dataframe = gpd.read_file(self._input_source, layer=layer, encoding=encoding)
+        self._dataframe = gpd.read_file(self._input_source, layer=layer, encoding=encoding, **_READ_FILE_OPTIONS)
 
     def read_layer(self, layer, encoding="utf-8") -> gpd.GeoDataFrame:
         self._layer = layer
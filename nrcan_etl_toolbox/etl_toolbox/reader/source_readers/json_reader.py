@@ -1,13 +1,69 @@
+import os
+
 import pandas as pd
 
 from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.base_reader import BaseDataReader
 
+try:
+    # orjson est optionnel (`pip install nrcan-etl-toolbox[json]`), sinon le module json standard est utilisé
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Orientations construites directement depuis les objets Python décodés, sans passer par pandas.read_json
+_DATAFRAME_BUILDERS = {
+    "records": pd.DataFrame.from_records,
+    "index": lambda obj: pd.DataFrame.from_dict(obj, orient="index"),
+    "columns": lambda obj: pd.DataFrame.from_dict(obj, orient="columns"),
+}
+
 
 class JSONReader(BaseDataReader):
     """
     Classe pour lire un fichier JSON et en extraire un DataFrame.
+
+    Avec `orient` égal à "records", "index" ou "columns", le fichier est décodé par orjson (ou json) et le
+    DataFrame construit directement ; les valeurs ne sont pas converties (dates comprises) comme le ferait
+    pandas.read_json. Les autres paramètres sont passés à pandas.read_json().
+
+    Avec `normalize=True`, les objets imbriqués sont aplatis en colonnes (`record_path` et `meta` comme pour
+    pandas.json_normalize), par fast_json_normalize s'il est installé et sans `record_path`/`meta`.
     """
 
+    def __init__(self, input_source, orient=None, normalize=False, record_path=None, meta=None, **kwargs):
+        super().__init__(input_source)
+        self._orient = orient
+        self._normalize = normalize
+        self._record_path = record_path
+        self._meta = meta
+        self._kwargs = kwargs
+
     def _read_data(self, **kwargs):
+        if self._normalize:
+            self._dataframe = self._normalize_json(_json_loads(self._read_bytes()))
+            return
+        read_json_kwargs = {**self._kwargs, **kwargs}
+        if self._orient in _DATAFRAME_BUILDERS and not read_json_kwargs:
+            self._dataframe = _DATAFRAME_BUILDERS[self._orient](_json_loads(self._read_bytes()))
+            return
         # Utilise pandas pour lire un fichier JSON
-        self._dataframe = pd.read_json(self._input_source, **kwargs)
+        if self._orient is not None:
+            read_json_kwargs["orient"] = self._orient
+        self._dataframe = pd.read_json(self._input_source, **read_json_kwargs)
+
+    def _normalize_json(self, obj):
+        if self._record_path is None and self._meta is None:
+            try:
+                # Implémentation compilée optionnelle, sans support de record_path/meta
+                from fast_json_normalize import fast_json_normalize
+            except ImportError:
+                pass
+            else:
+                return fast_json_normalize(obj)
+        return pd.json_normalize(obj, record_path=self._record_path, meta=self._meta)
+
+    def _read_bytes(self):
+        if isinstance(self._input_source, (str, os.PathLike)):
+            with open(self._input_source, "rb") as json_file:
+                return json_file.read()
+        return self._input_source.read()
@@ -1,16 +1,42 @@
 import geopandas as gpd
 import pandas as pd
-from sqlalchemy import Engine
+import shapely
+from sqlalchemy import Engine, Select, literal_column, select, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.base_reader import BaseDataReader
 
 
 class PostGisTableDataReader(BaseDataReader):
-    def __init__(self, input_source: Engine | Session, schema: str, table_name: str, geometry_column_name: str = None):
+    """
+    Reads a PostGIS/PostgreSQL table. `columns`, `where` (SQL condition) and `limit` are applied in the
+    query itself, so only the requested data is transferred.
+
+    With `backend="adbc"` (`pip install nrcan-etl-toolbox[adbc]`), rows are fetched as Arrow columns by the
+    ADBC PostgreSQL driver instead of Python tuples through the DB-API, on a connection opened from the engine URL.
+    """
+
+    def __init__(
+        self,
+        input_source: Engine | Session,
+        schema: str,
+        table_name: str,
+        geometry_column_name: str = None,
+        columns: list[str] = None,
+        where: str = None,
+        limit: int = None,
+        backend: str = "sqlalchemy",
+    ):
+        if backend not in ("sqlalchemy", "adbc"):
+            raise ValueError(f"Unsupported backend: {backend}")
         self._table_name = table_name
         self._schema = schema
         self._geometry_column_name = geometry_column_name
+        self._columns = columns
+        self._where = where
+        self._limit = limit
+        self._backend = backend
         super().__init__(input_source=input_source)
 
     @property
@@ -25,8 +51,30 @@ class PostGisTableDataReader(BaseDataReader):
     def formatted_table_name(self):
         return f"{self._schema}.{self._table_name}" if self._schema else self._table_name
 
+    def _build_query(self) -> Select:
+        """
+        SELECT of the requested columns (all by default). Identifiers are written as given, unquoted, like the
+        former `select * from schema.table` query: PostgreSQL folds them to lowercase unless the caller quotes them.
+        """
+        if self._columns:
+            column_names = list(self._columns)
+            if self._geometry_column_name is not None and self._geometry_column_name not in column_names:
+                column_names.append(self._geometry_column_name)
+            query = select(*(literal_column(name) for name in column_names))
+        else:
+            query = select(literal_column("*"))
+        query = query.select_from(text(self.formatted_table_name))
+        if self._where is not None:
+            query = query.where(text(self._where))
+        if self._limit is not None:
+            query = query.limit(self._limit)
+        return query
+
     def _read_data(self):
-        query = f"select * from {self._schema}.{self._table_name}"
+        query = self._build_query()
+        if self._backend == "adbc":
+            self._read_database_adbc(query)
+            return
         match self._input_source:
             case Session():
                 with self._input_source.begin() as session:
@@ -39,3 +87,28 @@ class PostGisTableDataReader(BaseDataReader):
             self._dataframe = pd.read_sql(query, con)
         else:
             self._dataframe = gpd.read_postgis(query, con=con, geom_col=self._geometry_column_name)
+
+    def _read_database_adbc(self, query: Select):
+        try:
+            import adbc_driver_postgresql.dbapi as adbc_postgresql
+        except ImportError as e:
+            raise ImportError(
+                "adbc-driver-postgresql is required for backend='adbc': pip install nrcan-etl-toolbox[adbc]"
+            ) from e
+
+        engine = self._input_source.get_bind() if isinstance(self._input_source, Session) else self._input_source
+        uri = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        with adbc_postgresql.connect(uri) as connection, connection.cursor() as cursor:
+            cursor.execute(sql)
+            dataframe = cursor.fetch_arrow_table().to_pandas()
+
+        if self._geometry_column_name is None:
+            self._dataframe = dataframe
+            return
+        # PostGIS geometries are received as EWKB: the CRS is taken from the SRID, as gpd.read_postgis does
+        geometries = gpd.GeoSeries.from_wkb(dataframe[self._geometry_column_name])
+        srids = shapely.get_srid(geometries.dropna().values[:1])
+        crs = int(srids[0]) if len(srids) and srids[0] > 0 else None
+        dataframe[self._geometry_column_name] = geometries
+        self._dataframe = gpd.GeoDataFrame(dataframe, geometry=self._geometry_column_name, crs=crs)
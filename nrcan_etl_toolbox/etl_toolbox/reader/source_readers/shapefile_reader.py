@@ -1,7 +1,12 @@
+from importlib.util import find_spec
+
 import geopandas as gpd
 
 from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.base_reader import BaseDataReader
 
+# Couche lue en un seul appel GDAL (pyogrio), transférée en colonnes Arrow si pyarrow est installé
+_READ_FILE_OPTIONS = {"engine": "pyogrio", "use_arrow": find_spec("pyarrow") is not None}
+
 
 class ShapefileReader(BaseDataReader):
     """
@@ -10,4 +15,4 @@ class ShapefileReader(BaseDataReader):
 
     def _read_data(self, **kwargs):
         # Utilise GeoPandas pour lire un fichier de type shapefile
-        self._dataframe = gpd.read_file(self._input_source, driver="ESRI Shapefile", **kwargs)
+        self._dataframe = gpd.read_file(self._input_source, driver="ESRI Shapefile", **{**_READ_FILE_OPTIONS, **kwargs})
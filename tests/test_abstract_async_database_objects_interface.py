@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Identity, Integer, String, UniqueConstraint
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Field, Relationship, SQLModel, select
+
+from nrcan_etl_toolbox.database.interface.abstract_async_database_objects_handlers import (
+    AbstractAsyncDatabaseObjectsInterface,
+)
+from nrcan_etl_toolbox.database.orm.base.base_table_mapping import Base
+
+pytest.importorskip("aiosqlite")
+
+
+class AsyncParentModel(Base, table=True):
+    __tablename__ = "test_async_parent_model"
+    __table_args__ = (UniqueConstraint("code"),)
+    id: int = Field(sa_column=Column(Integer, Identity(start=1), primary_key=True, autoincrement=True))
+    code: str = Field(sa_column=Column(String))
+    children: list["AsyncChildModel"] = Relationship(back_populates="parent")
+
+    @classmethod
+    def unique_keys(cls) -> list[str]:
+        return ["code"]
+
+
+class AsyncChildModel(Base, table=True):
+    __tablename__ = "test_async_child_model"
+    id: int = Field(sa_column=Column(Integer, Identity(start=1), primary_key=True, autoincrement=True))
+    name: str = Field(sa_column=Column(String))
+    parent_id: int = Field(sa_column=Column(Integer, ForeignKey("test_async_parent_model.id")))
+    parent: AsyncParentModel = Relationship(back_populates="children")
+
+
+def _run(coroutine_function):
+    """Exécute le test dans une boucle asyncio avec une interface sur une base SQLite en mémoire."""
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        try:
+            await coroutine_function(AbstractAsyncDatabaseObjectsInterface(engine=engine, logger_level="INFO"))
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_async_create_element_returns_generated_values():
+    async def check(interface):
+        element = await interface._create_element(AsyncParentModel, code="A")
+        assert element.id is not None
+        assert (await interface._get_element_in_database(AsyncParentModel, code="A"))[0].id == element.id
+
+    _run(check)
+
+
+def test_async_create_element_returns_existing_on_duplicate():
+    async def check(interface):
+        first = await interface._create_element(AsyncParentModel, code="A")
+        duplicate = await interface._create_element(AsyncParentModel, code="A")
+        assert duplicate.id == first.id
+
+    _run(check)
+
+
+def test_async_get_or_create_element_creates_once():
+    async def check(interface):
+        created = await interface._get_or_create_element(AsyncParentModel, code="A")
+        found = await interface._get_or_create_element(AsyncParentModel, code="A")
+        assert found[0].id == created[0].id
+        async with interface.get_session() as session:
+            assert len((await session.scalars(select(AsyncParentModel))).all()) == 1
+
+    _run(check)
+
+
+def test_async_create_element_sets_foreign_key_from_relationship():
+    async def check(interface):
+        parent = await interface._create_element(AsyncParentModel, code="A")
+        child = await interface._create_element(AsyncChildModel, name="child", parent=parent)
+        assert child.id is not None
+        assert child.parent_id == parent.id
+
+    _run(check)
@@ -0,0 +1,202 @@
+import pytest
+from sqlalchemy import Column, Identity, Integer, String, UniqueConstraint
+from sqlmodel import Field, SQLModel, create_engine, select
+
+from nrcan_etl_toolbox.database.interface import AbstractDatabaseObjectsInterface, abstract_database_objects_handlers
+from nrcan_etl_toolbox.database.orm import FONCTION_FILTER, LIMIT, ORDER_BY
+from nrcan_etl_toolbox.database.orm.base.base_table_mapping import Base
+
+
+class SampleInterfaceModel(Base, table=True):
+    __tablename__ = "test_interface_model"
+    __table_args__ = (UniqueConstraint("code"),)
+    id: int = Field(sa_column=Column(Integer, Identity(start=1), primary_key=True, autoincrement=True))
+    code: str = Field(sa_column=Column(String))
+    name: str = Field(sa_column=Column(String))
+
+    @classmethod
+    def unique_keys(cls) -> list[str]:
+        return ["code"]
+
+
+@pytest.fixture
+def interface():
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    yield AbstractDatabaseObjectsInterface(engine=engine, logger_level="INFO")
+    engine.dispose()
+
+
+def _count_rows(interface):
+    with interface.get_session() as session:
+        return len(session.scalars(select(SampleInterfaceModel)).all())
+
+
+def test_create_elements_inserts_all_rows_by_chunk(interface):
+    rows = [{"code": f"C{i}", "name": f"name {i}"} for i in range(25)]
+    inserted = interface._create_elements(SampleInterfaceModel, rows, chunk_size=10)
+    assert inserted == 25
+    assert _count_rows(interface) == 25
+
+
+def test_create_elements_accepts_orm_objects(interface):
+    objects = [SampleInterfaceModel(code="A", name="a"), SampleInterfaceModel(code="B", name="b")]
+    assert interface._create_elements(SampleInterfaceModel, objects) == 2
+    assert _count_rows(interface) == 2
+
+
+def test_create_elements_skips_duplicates(interface):
+    interface._create_elements(SampleInterfaceModel, [{"code": "A", "name": "a"}])
+    rows = [{"code": "A", "name": "a"}, {"code": "B", "name": "b"}, {"code": "C", "name": "c"}]
+    inserted = interface._create_elements(SampleInterfaceModel, rows)
+    assert inserted == 2
+    assert _count_rows(interface) == 3
+
+
+def test_associate_elements_skips_duplicates(interface):
+    associate_to = [SampleInterfaceModel(code="A", name="a")]
+    elements = [
+        SampleInterfaceModel(code="A", name="a"),
+        SampleInterfaceModel(code="B", name="b"),
+        None,
+        SampleInterfaceModel(code="B", name="b"),
+    ]
+    interface._associate_elements(elements, associate_to)
+    assert [elt.code for elt in associate_to] == ["A", "B"]
+
+
+def test_associate_elements_matches_partially_filled_elements(interface):
+    associate_to = [SampleInterfaceModel(code="A")]
+    interface._associate_elements([SampleInterfaceModel(code="A", name="a")], associate_to)
+    assert len(associate_to) == 1
+
+
+def test_get_or_create_elements_bulk_returns_aligned_elements(interface):
+    interface._create_elements(SampleInterfaceModel, [{"code": "A", "name": "a"}])
+    rows = [{"code": "B", "name": "b"}, {"code": "A", "name": "a"}, {"code": "B", "name": "b"}]
+    elements = interface._get_or_create_elements_bulk(SampleInterfaceModel, rows)
+    assert [elt.code for elt in elements] == ["B", "A", "B"]
+    assert all(elt.id is not None for elt in elements)
+    assert elements[0] is elements[2]
+    assert _count_rows(interface) == 2
+
+
+def test_get_or_create_elements_bulk_does_not_duplicate_null_keys(interface):
+    for _ in range(2):
+        elements = interface._get_or_create_elements_bulk(SampleInterfaceModel, [{"code": None, "name": "n"}])
+        assert elements[0].name == "n"
+    assert _count_rows(interface) == 1
+
+
+def test_get_or_create_elements_bulk_reselects_rows_skipped_by_conflict(interface, monkeypatch):
+    interface._create_elements(SampleInterfaceModel, [{"code": "A", "name": "a"}])
+    select_elements_by_key = interface._select_elements_by_key
+    calls = []
+
+    def select_after_concurrent_insert(*args):
+        # Le premier SELECT ne voit pas la ligne, comme si elle avait été insérée entre-temps
+        calls.append(args)
+        return {} if len(calls) == 1 else select_elements_by_key(*args)
+
+    monkeypatch.setattr(interface, "_select_elements_by_key", select_after_concurrent_insert)
+    elements = interface._get_or_create_elements_bulk(SampleInterfaceModel, [{"code": "A", "name": "a"}])
+    assert elements[0].code == "A"
+    assert _count_rows(interface) == 1
+
+
+def test_get_or_create_elements_bulk_without_on_conflict_support(interface, monkeypatch):
+    monkeypatch.delitem(abstract_database_objects_handlers._ON_CONFLICT_INSERTS, "sqlite")
+    interface._create_elements(SampleInterfaceModel, [{"code": "A", "name": "a"}])
+    rows = [{"code": "A", "name": "a"}, {"code": "B", "name": "b"}]
+    elements = interface._get_or_create_elements_bulk(SampleInterfaceModel, rows)
+    assert [elt.code for elt in elements] == ["A", "B"]
+    assert _count_rows(interface) == 2
+
+
+def test_create_elements_consumes_generator(interface):
+    rows = ({"code": f"C{i}", "name": f"name {i}"} for i in range(7))
+    assert interface._create_elements(SampleInterfaceModel, rows, chunk_size=3) == 7
+    assert _count_rows(interface) == 7
+
+
+def test_ensure_schema_creates_tables_once():
+    engine = create_engine("sqlite:///:memory:")
+    AbstractDatabaseObjectsInterface(engine=engine, logger_level="INFO", ensure_schema=True)
+    interface = AbstractDatabaseObjectsInterface(engine=engine, logger_level="INFO", ensure_schema=True)
+    assert interface._create_elements(SampleInterfaceModel, [{"code": "A", "name": "a"}]) == 1
+    engine.dispose()
+
+
+def test_create_element_returns_generated_values(interface):
+    element = interface._create_element(SampleInterfaceModel, code="A", name="a")
+    assert element.id is not None
+    assert element.code == "A"
+
+
+def test_create_element_returns_existing_on_duplicate(interface):
+    first = interface._create_element(SampleInterfaceModel, code="A", name="a")
+    duplicate = interface._create_element(SampleInterfaceModel, code="A", name="a")
+    assert duplicate.id == first.id
+    assert _count_rows(interface) == 1
+
+
+@pytest.mark.parametrize(
+    "date_string, expected",
+    [
+        ("2024-05-17", True),
+        ("2024-05-17T10:30:00", True),
+        ("2024-05-17T10:30:00.123Z", True),
+        ("2024-05-17 10:30+02:00", True),
+        ("17 May 2024", True),
+        ("2024-13-45", False),
+        ("not a date", False),
+        (20240517, False),
+    ],
+)
+def test_is_date_valid(date_string, expected):
+    assert AbstractDatabaseObjectsInterface._is_date_valid(date_string) is expected
+
+
+def test_interfaces_share_engine_per_database_url(tmp_path):
+    first = AbstractDatabaseObjectsInterface(database_url=f"sqlite:///{tmp_path / 'first.db'}", logger_level="INFO")
+    same = AbstractDatabaseObjectsInterface(database_url=f"sqlite:///{tmp_path / 'first.db'}", logger_level="INFO")
+    other = AbstractDatabaseObjectsInterface(database_url=f"sqlite:///{tmp_path / 'other.db'}", logger_level="INFO")
+    assert first.engine is same.engine
+    assert first.engine is not other.engine
+
+
+def test_create_elements_without_on_conflict_support(interface, monkeypatch):
+    monkeypatch.delitem(abstract_database_objects_handlers._ON_CONFLICT_INSERTS, "sqlite")
+    interface._create_elements(SampleInterfaceModel, [{"code": "C3", "name": "c3"}, {"code": "C6", "name": "c6"}])
+    rows = [{"code": f"C{i}", "name": f"name {i}"} for i in range(8)]
+    assert interface._create_elements(SampleInterfaceModel, rows) == 6
+    assert _count_rows(interface) == 8
+
+
+@pytest.mark.parametrize(
+    "input_date, expected",
+    [
+        ("Published 2021-03-15", "2021-03-15"),
+        ("2021-03", "2021-03-01"),
+        ("03-2021", "2021-03-01"),
+        ("circa 2021", "2021-01-01"),
+        ("unknown", None),
+    ],
+)
+def test_normalize_date(input_date, expected):
+    assert AbstractDatabaseObjectsInterface.normalize_date(input_date) == expected
+
+
+def test_similarity_filters_one_threshold_per_column():
+    result = AbstractDatabaseObjectsInterface._get_similarity_func_and_order_by_for_column(
+        [SampleInterfaceModel.code, SampleInterfaceModel.name], "abc", similarity_filter=0.5
+    )
+    assert len(result[FONCTION_FILTER]) == 2
+    assert result[ORDER_BY] is not None
+    assert result[LIMIT] == 10
+
+
+def test_similarity_filters_empty_for_unsupported_column():
+    result = AbstractDatabaseObjectsInterface._get_similarity_func_and_order_by_for_column(None, "abc")
+    assert result[FONCTION_FILTER] == []
+    assert result[ORDER_BY] is None
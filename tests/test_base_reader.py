@@ -57,3 +57,8 @@ def test_base_datareader_raises_error_when_no_data():
     reader = DummyDataReader(input_source="dummy_source")
     with pytest.raises(ValueError, match="No data provided"):
         _ = reader.dataframe
+
+
+def test_to_lowercase_columns():
+    dataframe = pd.DataFrame(columns=["Col A", "B  C", "d", 3])
+    assert list(BaseDataReader._to_lowercase_columns(dataframe).columns) == ["col_a", "b__c", "d", 3]
@@ -2,7 +2,7 @@ import datetime
 from typing import Optional
 
 import pytest
-from sqlalchemy import Column, DateTime, Identity, Integer, String
+from sqlalchemy import JSON, Column, Date, DateTime, Identity, Integer, String
 from sqlalchemy.orm import Session
 from sqlmodel import Field, SQLModel, create_engine
 from sqlmodel import Session as SQLModelSession
@@ -36,6 +36,20 @@ class SampleModel2(Base, table=True):
     created_at: Optional[datetime.datetime] = Column(DateTime, default=datetime.date.today)  # exécuté en Python
 
 
+class SampleModel3(Base, table=True):
+    __tablename__ = "test_sample_model3"
+    id: int = Field(sa_column=Column(Integer, Identity(start=1), primary_key=True, autoincrement=True))
+    name: str = Field(sa_column=Column(String))
+    name_as_default: str = Field(sa_column=Column(String, default=DEFAULT_STR_VALUE))
+    created_on: datetime.date | None = Field(sa_column=Column(Date, default=datetime.date.today))
+
+
+class SampleJsonModel(Base, table=True):
+    __tablename__ = "test_sample_json_model"
+    id: int = Field(sa_column=Column(Integer, Identity(start=1), primary_key=True, autoincrement=True))
+    properties: dict = Field(sa_column=Column(JSON))
+
+
 def test_base_equality_method(test_session: Session):
     obj1 = SampleModel(id=1, name="Test")
     obj2 = SampleModel(id=1, name="Test")
@@ -102,3 +116,77 @@ def test_remove_accents_characters_from_string():
     result = Base.remove_accents_characters_from_string(s_4)
     assert len(result) == len(s_4)
     assert result == s_4, "Special characters should not be removed"
+
+    s_5 = "cafe\u0301"
+    result = Base.remove_accents_characters_from_string(s_5)
+    assert result == "caf_", "Decomposed accents should be replaced like precomposed ones"
+
+
+def test_formatted_parameter():
+    assert Base._formatted_parameter("Café") == "%caf_%"
+    assert Base._formatted_parameter("Café") == "%caf_%", "Cached result should be identical"
+    assert Base._formatted_parameter("%") == "%"
+
+
+def test_query_object(test_session: Session):
+    test_session.add_all([SampleModel(id=1, name="Test"), SampleModel(id=2, name="Other")])
+    test_session.commit()
+
+    result = SampleModel.query_object(session=test_session, condition="and", name="Test")
+    assert [obj.id for obj in result] == [1]
+    assert SampleModel.query_object(session=test_session, condition="and", name="Missing") == []
+    assert "NULL" not in str(SampleModel.get_query_for_object(session=test_session, condition="and", name="%"))
+    assert len(SampleModel.query_all_rows(session=test_session)) == 2
+
+
+def test_query_object_with_list_of_values(test_session: Session):
+    test_session.add_all([SampleModel(id=1, name="Test"), SampleModel(id=2, name="Other"), SampleModel(id=3, name="X")])
+    test_session.commit()
+
+    result = SampleModel.query_object(session=test_session, condition="or", name=["Test", "Other"])
+    assert sorted(obj.id for obj in result) == [1, 2]
+    query = SampleModel.get_query_for_object(session=test_session, condition="or", name=["Test", "Other"])
+    assert " IN " in str(query)
+    assert "LIKE" in str(query)
+
+
+def test_get_columns_and_relations():
+    assert SampleModel2._get_columns() == ["id", "name", "name_as_default", "created_at"]
+    assert SampleModel2._get_relations() == []
+    assert SampleModel2(name="Test").get_identity_columns == ["id"]
+
+
+def test_base_equality_compares_primary_key_first():
+    assert SampleModel._get_compared_primary_key_names() == ("id",)
+    assert SampleModel2._get_compared_primary_key_names() == ()
+    assert SampleModel(id=1, name="Test") != SampleModel(id=2, name="Test")
+    assert SampleModel(id=1, name="Test") != SampleModel(id=1, name="Other")
+
+
+def test_callable_default_is_not_invoked_for_comparison():
+    obj = SampleModel3(name="Test", created_on=datetime.date(2000, 1, 1))
+    assert SampleModel3._get_column_default("created_on")[1] is None
+    assert not obj._is_value_equal_default_gen_col("created_on")
+    with_default = SampleModel3(name="Test", name_as_default=DEFAULT_STR_VALUE)
+    assert with_default._is_value_equal_default_gen_col("name_as_default")
+    assert "created_on" in obj._get_columns_if_not_auto_gen()
+    assert obj != SampleModel3(name="Test", created_on=datetime.date(2000, 1, 2))
+    assert hash(obj) == hash(SampleModel3(name="Test", created_on=datetime.date(2000, 1, 1)))
+
+
+def test_get_columns_if_not_auto_gen_skips_identity_and_null_columns():
+    assert SampleModel3._get_non_identity_column_names() == ("name", "name_as_default", "created_on")
+    assert SampleModel3(id=5, name="Test")._get_columns_if_not_auto_gen() == ["name"]
+
+
+def test_base_equality_and_hash_with_json_column():
+    obj1 = SampleJsonModel(properties={"b": [1, {"c": 2}], "a": 1})
+    obj2 = SampleJsonModel(properties={"a": 1, "b": [1, {"c": 2}]})
+    assert obj1 == obj2
+    assert hash(obj1) == hash(obj2)
+    assert obj1 != SampleJsonModel(properties={"a": 2, "b": [1, {"c": 2}]})
+
+
+def test_get_textual_column_names():
+    assert SampleModel._get_textual_column_names() == frozenset({"name"})
+    assert SampleModel3._get_textual_column_names() == frozenset({"name", "name_as_default"})
@@ -0,0 +1,57 @@
+# tests/test_csv_reader.py
+
+import pytest
+
+from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.csv_reader import CSVReader
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("Col A,Col B\n1,x\n2,y\n3,z\n")
+    return path
+
+
+def test_csv_reader_reads_with_c_engine(csv_file):
+    reader = CSVReader(csv_file, engine="c")
+    assert reader.columns == ["col_a", "col_b"]
+    assert len(reader.dataframe) == 3
+
+
+def test_csv_reader_falls_back_to_pandas_engine_for_unsupported_options(csv_file):
+    assert CSVReader(csv_file, engine="pyarrow")._select_engine({}) == "pyarrow"
+    assert CSVReader(csv_file, engine="pyarrow", skipfooter=1)._select_engine({}) == "python"
+    assert CSVReader(csv_file, engine="pyarrow", nrows=2)._select_engine({}) is None
+    assert CSVReader(csv_file, engine="pyarrow")._select_engine({"thousands": ","}) is None
+    assert CSVReader(csv_file, engine="pyarrow", skiprows=[1, 3])._select_engine({}) is None
+    assert CSVReader(csv_file, engine="pyarrow", delimiter=None)._select_engine({}) is None
+    assert CSVReader(csv_file, engine="pyarrow", delimiter=r"\s*,\s*")._select_engine({}) is None
+
+
+def test_csv_reader_uses_pandas_default_engine(csv_file):
+    assert CSVReader(csv_file)._select_engine({}) is None
+
+
+def test_csv_reader_pyarrow_engine_with_unsupported_options(csv_file):
+    pytest.importorskip("pyarrow")
+    assert CSVReader(csv_file, engine="pyarrow").dataframe["col_a"].tolist() == [1, 2, 3]
+    assert CSVReader(csv_file, engine="pyarrow", skiprows=[1, 3]).dataframe["col_a"].tolist() == [2]
+    assert CSVReader(csv_file, engine="pyarrow", delimiter=None).columns == ["col_a", "col_b"]
+
+
+def test_csv_reader_skipfooter(csv_file):
+    reader = CSVReader(csv_file, engine="pyarrow", skipfooter=1)
+    assert len(reader.dataframe) == 2
+
+
+def test_csv_reader_iterates_chunks(csv_file):
+    reader = CSVReader(csv_file, chunksize=2)
+    chunks = list(reader.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[0].columns) == ["col_a", "col_b"]
+    assert reader.dataframe["col_a"].tolist() == [1, 2, 3]
+
+
+def test_csv_reader_iter_chunks_requires_chunksize(csv_file):
+    with pytest.raises(ValueError, match="chunksize"):
+        next(CSVReader(csv_file).iter_chunks())
@@ -1,12 +1,16 @@
 # tests/test_etl_logger.py
 
+import gc
 import logging
 import os
 import pathlib
 import shutil
 import tempfile
 
-from nrcan_etl_toolbox.etl_logging.etl_logger import CustomLogger
+import pytest
+
+from nrcan_etl_toolbox.etl_logging import etl_logger
+from nrcan_etl_toolbox.etl_logging.etl_logger import CachedFormatter, CustomLogger
 
 TMP_DIR = pathlib.Path(tempfile.TemporaryDirectory().name)
 
@@ -45,3 +49,114 @@ def test_logger_file_path_creation():
     assert tmp_file_dir / composed_logger_file_name in tmp_file_dir.iterdir()
     del logger
     shutil.rmtree(tmp_file_dir, ignore_errors=True)
+
+
+def test_logger_writes_records_from_background_thread():
+    tmp_file_dir = pathlib.Path(TMP_DIR) / "test_logger_writes_records_from_background_thread"
+    logger = CustomLogger(name="queue_logger", file_path=tmp_file_dir, logger_type="simple")
+    logger.info("value is %s", 42)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.error("failure", exc_info=True)
+    logger.flush()
+
+    content = pathlib.Path(logger._file_path).read_text()
+    assert "value is 42" in content
+    assert "ValueError: boom" in content
+    logger.close()
+    shutil.rmtree(tmp_file_dir, ignore_errors=True)
+
+
+def test_progress_records_are_filtered_when_not_verbose():
+    tmp_file_dir = pathlib.Path(TMP_DIR) / "test_progress_records_are_filtered_when_not_verbose"
+    logger = CustomLogger(name="progress_logger", file_path=tmp_file_dir, logger_type="simple")
+    logger.progress("step done")
+    logger.info("info message")
+    logger.flush()
+
+    content = pathlib.Path(logger._file_path).read_text()
+    assert "step done" not in content
+    assert "info message" in content
+    shutil.rmtree(tmp_file_dir, ignore_errors=True)
+
+
+def test_cached_formatter_formats_each_record_once(monkeypatch):
+    formatter = CachedFormatter("%(levelname)s :: %(message)s")
+    other_formatter = CachedFormatter("%(message)s")
+    record = logging.LogRecord("cached", logging.INFO, __file__, 1, "value=%s", (42,), None)
+    calls = []
+    monkeypatch.setattr(logging.Formatter, "formatMessage", lambda self, rec: calls.append(rec) or rec.message)
+
+    assert formatter.format(record) == formatter.format(record) == "value=42"
+    assert other_formatter.format(record) == "value=42"
+    assert len(calls) == 2
+
+
+def test_logger_context_manager_closes_file_handlers():
+    with CustomLogger(name="context_logger", file_path=TMP_DIR / "context") as logger:
+        logger.warning("written before closing")
+        file_handler = next(h for h in logger._output_handlers if isinstance(h, logging.FileHandler))
+    assert file_handler.stream is None
+    assert logger.handlers == []
+    assert "written before closing" in pathlib.Path(logger._file_path).read_text()
+
+
+def test_logger_finalizer_closes_file_handlers_when_collected():
+    logger = CustomLogger(name="collected_logger", file_path=TMP_DIR / "collected")
+    logger.warning("written before finalizing")
+    file_handler = next(h for h in logger._output_handlers if isinstance(h, logging.FileHandler))
+    finalizer = logger._finalizer
+    del logger
+    gc.collect()
+    assert not finalizer.alive
+    assert file_handler.stream is None
+
+
+def test_progress_does_not_build_records_when_not_verbose(monkeypatch):
+    logger = CustomLogger(name="quiet_progress_logger", file_path=TMP_DIR, logger_type="simple")
+    monkeypatch.setattr(logger, "makeRecord", lambda *args, **kwargs: pytest.fail("record built"))
+    logger.progress("step done")
+
+
+def test_logger_handlers_expose_output_handlers_written_once():
+    tmp_file_dir = pathlib.Path(TMP_DIR) / "test_logger_handlers_expose_output_handlers_written_once"
+    logger = CustomLogger(name="exposed_logger", file_path=tmp_file_dir, logger_type="simple")
+    assert any(isinstance(h, logging.FileHandler) for h in logger.handlers)
+    assert any(type(h) is logging.StreamHandler for h in logger.handlers)
+    logger.info("written once")
+    logger.flush()
+
+    assert pathlib.Path(logger._file_path).read_text().count("written once") == 1
+    logger.close()
+    shutil.rmtree(tmp_file_dir, ignore_errors=True)
+
+
+def test_logger_writes_synchronously_after_dispatcher_stopped():
+    tmp_file_dir = pathlib.Path(TMP_DIR) / "test_logger_writes_synchronously_after_dispatcher_stopped"
+    logger = CustomLogger(name="exit_logger", file_path=tmp_file_dir, logger_type="simple")
+    etl_logger._stop_log_dispatcher()
+    try:
+        logger.info("logged by an atexit handler")
+        assert "logged by an atexit handler" in pathlib.Path(logger._file_path).read_text()
+    finally:
+        etl_logger._start_log_dispatcher()
+    logger.close()
+    shutil.rmtree(tmp_file_dir, ignore_errors=True)
+
+
+def test_removed_file_handler_is_no_longer_written():
+    tmp_file_dir = pathlib.Path(TMP_DIR) / "test_removed_file_handler_is_no_longer_written"
+    logger = CustomLogger(name="removed_handler_logger", file_path=tmp_file_dir, logger_type="simple")
+    file_handler = next(h for h in logger.handlers if isinstance(h, logging.FileHandler))
+    logger.info("before removal")
+    logger.removeHandler(file_handler)
+    logger.info("after removal")
+    logger.flush()
+    file_handler.close()
+
+    content = pathlib.Path(logger._file_path).read_text()
+    assert "before removal" in content
+    assert "after removal" not in content
+    logger.close()
+    shutil.rmtree(tmp_file_dir, ignore_errors=True)
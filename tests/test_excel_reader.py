@@ -236,3 +236,77 @@ def test_excel_reader_reset_internal_dataframe():
         del reader
         # Remove the temporary file after the test
         os.unlink(temp_file)
+
+
+def test_excel_reader_opens_workbook_on_first_access():
+    temp_file = _create_temp_excel_file([{"A": [1]}], [SHEET_1_NAME])
+    try:
+        reader = ExcelReader(input_source=temp_file)
+        assert "_original_file" not in reader.__dict__
+        assert reader.list_sheet_names == [SHEET_1_NAME]
+        assert "_original_file" in reader.__dict__
+        del reader
+
+    finally:
+        os.unlink(temp_file)
+
+
+def test_excel_reader_read_sheet_keeps_internal_dataframe():
+    temp_file = _create_temp_excel_file_two_sheets_different_data()
+    try:
+        reader = ExcelReader(input_source=temp_file)
+        reader.read_sheet(sheet_name=SHEET_1_NAME, set_internal_dataframe=True)
+        dataframe = reader.read_sheet(sheet_name=SHEET_2_NAME)
+        assert list(dataframe.columns) == [SHEET_2_COL_1_NAME, SHEET_2_COL_2_NAME]
+        assert list(reader.dataframe.columns) == [SHEET_1_COL_1_NAME, SHEET_1_COL_2_NAME]
+        del reader
+
+    finally:
+        os.unlink(temp_file)
+
+
+def test_excel_reader_uses_given_engine():
+    temp_file = _create_temp_excel_file([{"A": [1]}], [SHEET_1_NAME])
+    try:
+        reader = ExcelReader(input_source=temp_file, engine="openpyxl")
+        assert reader._original_file.engine == "openpyxl"
+        del reader
+
+    finally:
+        os.unlink(temp_file)
+
+
+def test_excel_readers_share_workbook_of_same_file():
+    temp_file = _create_temp_excel_file_two_sheets_different_data()
+    try:
+        first_reader = ExcelReader(input_source=temp_file)
+        second_reader = ExcelReader(input_source=temp_file)
+        assert first_reader._original_file is second_reader._original_file
+        del first_reader
+        assert list(second_reader.read_sheet(SHEET_2_NAME).columns) == [SHEET_2_COL_1_NAME, SHEET_2_COL_2_NAME]
+        del second_reader
+
+    finally:
+        os.unlink(temp_file)
+
+
+def test_excel_reader_caches_sheet_reads(monkeypatch):
+    temp_file = _create_temp_excel_file_two_sheets_different_data()
+    try:
+        reader = ExcelReader(input_source=temp_file)
+        read_excel_calls = []
+        read_excel = pd.read_excel
+        monkeypatch.setattr(
+            pd, "read_excel", lambda *args, **kwargs: read_excel_calls.append(1) or read_excel(*args, **kwargs)
+        )
+
+        first = reader.read_sheet(SHEET_1_NAME, cols_to_lowercase=True)
+        second = reader.read_sheet(SHEET_1_NAME)
+        reader.read_sheet(SHEET_1_NAME, skiprows=1)
+        assert len(read_excel_calls) == 2
+        assert list(first.columns) == [SHEET_1_COL_1_NAME.lower(), SHEET_1_COL_2_NAME.lower()]
+        assert list(second.columns) == [SHEET_1_COL_1_NAME, SHEET_1_COL_2_NAME]
+        del reader
+
+    finally:
+        os.unlink(temp_file)
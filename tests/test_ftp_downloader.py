@@ -0,0 +1,272 @@
+import ftplib
+import os
+import zlib
+from unittest.mock import MagicMock
+
+import paramiko
+
+from nrcan_etl_toolbox.etl_toolbox.data_downloader.ftp.ftp_downloader import (
+    FTP_SERVER_TYPE,
+    DownloaderFactory,
+    FTPDownloader,
+    SFTPDownloader,
+)
+
+
+def _fake_cwd(path):
+    if path not in ("/", "/data"):
+        raise ftplib.error_perm("550 Not a directory")
+
+
+def test_ftp_directory_exists_is_cached_per_connection():
+    downloader = FTPDownloader("localhost")
+    downloader.ftp = MagicMock()
+    downloader.ftp.pwd.return_value = "/"
+    downloader.ftp.cwd.side_effect = _fake_cwd
+
+    assert downloader.directory_exists("/data")
+    assert not downloader.directory_exists("/data/file.csv")
+    assert downloader.directory_exists("/data")
+    assert not downloader.directory_exists("/data/file.csv")
+    assert downloader.ftp.pwd.call_count == 2
+
+    downloader.disconnect()
+    assert downloader._directory_cache == {}
+
+
+def test_sftp_directory_exists_is_cached_per_connection():
+    downloader = SFTPDownloader("localhost", "user")
+    downloader.sftp_client = MagicMock()
+    downloader.sftp_client.stat.return_value.st_mode = 0o040755
+
+    assert downloader.directory_exists("/data")
+    assert downloader.directory_exists("/data")
+    downloader.sftp_client.stat.assert_called_once_with("/data")
+
+
+def test_ftp_recursive_download_uses_mlsd_types(tmp_path):
+    downloader = FTPDownloader("localhost")
+    downloader.ftp = MagicMock()
+    downloader.ftp.mlsd.side_effect = lambda path, facts: {
+        "/data": [(".", {"type": "cdir"}), ("sub", {"type": "dir"}), ("a.csv", {"type": "file"})],
+        "/data/sub": [("b.csv", {"type": "file"})],
+    }[path]
+
+    downloader._download_directory_recursive_ftp("/data", tmp_path)
+
+    downloader.ftp.cwd.assert_not_called()
+    retrieved = [call.args[0] for call in downloader.ftp.retrbinary.call_args_list]
+    assert retrieved == ["RETR /data/sub/b.csv", "RETR /data/a.csv"]
+
+
+def test_ftp_recursive_download_falls_back_to_nlst(tmp_path):
+    downloader = FTPDownloader("localhost")
+    downloader.ftp = MagicMock()
+    downloader.ftp.mlsd.side_effect = ftplib.error_perm("500 Unknown command")
+    downloader.ftp.nlst.return_value = ["/data/a.csv"]
+    downloader.ftp.pwd.return_value = "/"
+    downloader.ftp.cwd.side_effect = _fake_cwd
+
+    downloader._download_directory_recursive_ftp("/data", tmp_path)
+
+    downloader.ftp.retrbinary.assert_called_once()
+    assert downloader.ftp.retrbinary.call_args.args[0] == "RETR /data/a.csv"
+    assert downloader.ftp.retrbinary.call_args.kwargs["blocksize"] == 1 << 20
+
+
+def test_sftp_recursive_download_uses_listdir_attr(tmp_path):
+    downloader = SFTPDownloader("localhost", "user")
+    downloader.sftp_client = MagicMock()
+    downloader.sftp_client.listdir_attr.side_effect = lambda path: {
+        "/data": [_sftp_attributes("sub", 0o040755), _sftp_attributes("a.csv", 0o100644)],
+        "/data/sub": [_sftp_attributes("b.csv", 0o100644)],
+    }[path]
+
+    downloader._download_directory_recursive("/data", tmp_path)
+
+    downloader.sftp_client.stat.assert_not_called()
+    retrieved = [call.args[0] for call in downloader.sftp_client.getfo.call_args_list]
+    assert retrieved == ["/data/sub/b.csv", "/data/a.csv"]
+
+
+def _sftp_attributes(filename, st_mode):
+    attributes = paramiko.SFTPAttributes()
+    attributes.filename = filename
+    attributes.st_mode = st_mode
+    return attributes
+
+
+def test_sftp_download_multiple_files_uses_one_channel_per_worker(tmp_path):
+    downloader = SFTPDownloader("localhost", "user", max_workers=3)
+    downloader.ssh_client = MagicMock()
+    downloader.sftp_client = MagicMock()
+    channels = [MagicMock() for _ in range(3)]
+    downloader.ssh_client.open_sftp.side_effect = channels
+    for channel in channels:
+        channel.stat.return_value.st_mode = 0o100644
+
+    file_list = [f"/data/file_{i}.csv" for i in range(10)]
+    assert downloader.download_multiple_files(file_list, tmp_path) == 10
+
+    retrieved = sorted(call.args[0] for channel in channels for call in channel.getfo.call_args_list)
+    assert retrieved == sorted(file_list)
+    downloader.sftp_client.getfo.assert_not_called()
+    for channel in channels:
+        channel.close.assert_called_once()
+    downloader.ssh_client.close.assert_not_called()
+
+
+def test_sftp_download_multiple_files_uses_channels_opened_before_refusal(tmp_path):
+    downloader = SFTPDownloader("localhost", "user", max_workers=3)
+    downloader.ssh_client = MagicMock()
+    downloader.sftp_client = MagicMock()
+    channel = MagicMock()
+    channel.stat.return_value.st_mode = 0o100644
+    downloader.ssh_client.open_sftp.side_effect = [channel, paramiko.ChannelException(1, "MaxSessions")]
+
+    file_list = [f"/data/file_{i}.csv" for i in range(5)]
+    assert downloader.download_multiple_files(file_list, tmp_path) == 5
+
+    assert channel.getfo.call_count == 5
+    channel.close.assert_called_once()
+
+
+def test_sftp_download_multiple_files_is_sequential_without_extra_channel(tmp_path):
+    downloader = SFTPDownloader("localhost", "user", max_workers=3)
+    downloader.ssh_client = MagicMock()
+    downloader.sftp_client = MagicMock()
+    downloader.sftp_client.stat.return_value.st_mode = 0o100644
+    downloader.ssh_client.open_sftp.side_effect = paramiko.ChannelException(1, "MaxSessions")
+
+    assert downloader.download_multiple_files(["/data/a.csv", "/data/b.csv"], tmp_path) == 2
+    assert downloader.sftp_client.getfo.call_count == 2
+
+
+def test_ftp_download_multiple_files_skips_refused_connections(tmp_path, monkeypatch):
+    downloader = FTPDownloader("localhost", max_workers=2)
+    downloader.ftp = MagicMock()
+    downloader.ftp.pwd.return_value = "/"
+    downloader.ftp.cwd.side_effect = _fake_cwd
+
+    def refuse_login(self):
+        self.ftp = MagicMock()
+        return False
+
+    monkeypatch.setattr(FTPDownloader, "connect", refuse_login)
+
+    assert downloader.download_multiple_files(["/data/a.csv", "/data/b.csv"], tmp_path) == 2
+    assert downloader.ftp.retrbinary.call_count == 2
+
+
+def test_ftp_download_multiple_files_is_sequential_by_default(tmp_path):
+    downloader = FTPDownloader("localhost")
+    downloader.ftp = MagicMock()
+    downloader.ftp.pwd.return_value = "/"
+    downloader.ftp.cwd.side_effect = _fake_cwd
+
+    assert downloader.download_multiple_files(["/data/a.csv", "/data/b.csv"], tmp_path) == 2
+    assert downloader.ftp.retrbinary.call_count == 2
+
+
+def test_ftp_mode_z_download_is_decompressed(tmp_path):
+    content = b"col1,col2\n" * 1000
+    downloader = FTPDownloader("localhost", compress=True)
+    downloader.ftp = MagicMock()
+    downloader._mode_z = downloader._enable_mode_z()
+    compressed = zlib.compress(content)
+    downloader.ftp.retrbinary.side_effect = lambda cmd, callback, blocksize: [
+        callback(compressed[i : i + 100]) for i in range(0, len(compressed), 100)
+    ]
+
+    downloader._retrieve_file("/data/a.csv", tmp_path / "a.csv")
+
+    downloader.ftp.voidcmd.assert_called_once_with("MODE Z")
+    assert (tmp_path / "a.csv").read_bytes() == content
+
+
+def test_ftp_mode_z_is_only_used_for_file_transfers(tmp_path):
+    downloader = FTPDownloader("localhost", compress=True)
+    downloader.ftp = MagicMock()
+    downloader._mode_z = downloader._enable_mode_z()
+    downloader.ftp.nlst.return_value = ["a.csv"]
+    downloader.ftp.mlsd.return_value = [("a.csv", {"type": "file"})]
+    downloader.ftp.retrbinary.side_effect = lambda cmd, callback, blocksize: callback(zlib.compress(b"data"))
+
+    assert downloader.list_files("/data") == ["a.csv"]
+    downloader._download_directory_recursive_ftp("/data", tmp_path)
+    assert downloader.list_files("/data") == ["a.csv"]
+
+    commands = [
+        args[0] if name == "voidcmd" else name
+        for name, args, _ in downloader.ftp.method_calls
+        if name in ("voidcmd", "nlst", "mlsd", "retrbinary")
+    ]
+    assert commands == ["MODE Z", "MODE S", "nlst", "mlsd", "MODE Z", "retrbinary", "MODE S", "nlst"]
+    assert (tmp_path / "a.csv").read_bytes() == b"data"
+
+
+def test_sftp_downloaders_share_pooled_ssh_connection(monkeypatch):
+    opened = []
+
+    def open_ssh_client(self):
+        opened.append(MagicMock())
+        return opened[-1]
+
+    monkeypatch.setattr(SFTPDownloader, "_open_ssh_client", open_ssh_client)
+    first = DownloaderFactory.create_downloader(FTP_SERVER_TYPE.SFTP, "localhost", "user", reuse_connection=True)
+    second = DownloaderFactory.create_downloader(FTP_SERVER_TYPE.SFTP, "localhost", "user", reuse_connection=True)
+    try:
+        assert first.connect() and second.connect()
+        assert len(opened) == 1
+        assert first.ssh_client is second.ssh_client
+
+        first.disconnect()
+        opened[0].close.assert_not_called()
+    finally:
+        DownloaderFactory.close_pool()
+    opened[0].close.assert_called_once()
+
+
+def test_sftp_pooled_ssh_connection_is_not_shared_across_credentials(monkeypatch):
+    monkeypatch.setattr(SFTPDownloader, "_open_ssh_client", lambda self: MagicMock())
+    downloaders = [
+        SFTPDownloader("localhost", "user", password="secret", reuse_connection=True),
+        SFTPDownloader("localhost", "user", password="secret", reuse_connection=True),
+        SFTPDownloader("localhost", "user", password="wrong", reuse_connection=True),
+        SFTPDownloader("localhost", "user", key_file_path="/keys/id_rsa", reuse_connection=True),
+    ]
+    try:
+        assert all(downloader.connect() for downloader in downloaders)
+        assert downloaders[0].ssh_client is downloaders[1].ssh_client
+        assert len({id(downloader.ssh_client) for downloader in downloaders}) == 3
+    finally:
+        DownloaderFactory.close_pool()
+
+
+def test_ftp_download_drops_page_cache(tmp_path, monkeypatch):
+    advised = []
+    monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, advice: advised.append(advice), raising=False)
+    downloader = FTPDownloader("localhost", drop_page_cache=True)
+    downloader.ftp = MagicMock()
+    downloader.ftp.retrbinary.side_effect = lambda cmd, callback, blocksize: callback(b"data")
+
+    downloader._retrieve_file("/data/a.csv", tmp_path / "a.csv")
+
+    assert (tmp_path / "a.csv").read_bytes() == b"data"
+    assert advised == [os.POSIX_FADV_DONTNEED]
+
+
+def test_sftp_recursive_download_collects_skipped_files(tmp_path):
+    downloader = SFTPDownloader("localhost", "user")
+    downloader.sftp_client = MagicMock()
+    downloader.sftp_client.listdir_attr.return_value = [
+        _sftp_attributes("a.csv", 0o100644),
+        _sftp_attributes("b.txt", 0o100644),
+        _sftp_attributes("c.txt", 0o100644),
+    ]
+    skipped = []
+
+    downloader._download_directory_recursive("/data", tmp_path, file_filter=".csv", skipped=skipped)
+
+    assert skipped == ["b.txt", "c.txt"]
+    assert downloader.sftp_client.getfo.call_count == 1
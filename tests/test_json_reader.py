@@ -0,0 +1,49 @@
+# tests/test_json_reader.py
+
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.json_reader import JSONReader
+
+RECORDS = [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+
+@pytest.mark.parametrize(
+    "orient, payload",
+    [
+        ("records", RECORDS),
+        ("index", {"0": RECORDS[0], "1": RECORDS[1]}),
+        ("columns", {"a": {"0": 1, "1": 2}, "b": {"0": "x", "1": "y"}}),
+    ],
+)
+def test_json_reader_builds_dataframe_from_decoded_json(tmp_path, orient, payload):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(payload))
+    dataframe = JSONReader(path, orient=orient).dataframe
+    assert dataframe["a"].tolist() == [1, 2]
+    assert dataframe["b"].tolist() == ["x", "y"]
+
+
+def test_json_reader_reads_file_objects():
+    reader = JSONReader(io.BytesIO(json.dumps(RECORDS).encode()), orient="records")
+    assert reader.columns == ["a", "b"]
+
+
+def test_json_reader_without_orient_uses_pandas(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(RECORDS))
+    pd.testing.assert_frame_equal(JSONReader(path).dataframe, pd.read_json(path))
+
+
+def test_json_reader_normalizes_nested_records(tmp_path):
+    path = tmp_path / "nested.json"
+    path.write_text(json.dumps([{"id": 1, "site": {"name": "A", "items": [{"v": 1}, {"v": 2}]}}]))
+
+    flat = JSONReader(path, normalize=True).dataframe
+    assert {"id", "site.name"} <= set(flat.columns)
+
+    items = JSONReader(path, normalize=True, record_path=["site", "items"], meta=["id"]).dataframe
+    assert items.to_dict("records") == [{"v": 1, "id": 1}, {"v": 2, "id": 1}]
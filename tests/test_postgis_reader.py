@@ -0,0 +1,40 @@
+# tests/test_postgis_reader.py
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from nrcan_etl_toolbox.etl_toolbox.reader.source_readers.postgis_reader import PostGisTableDataReader
+
+
+def _compile(reader):
+    return str(reader._build_query().compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_query_selects_whole_table_by_default():
+    reader = PostGisTableDataReader(None, schema="public", table_name="sites")
+    assert " ".join(_compile(reader).split()) == "SELECT * FROM public.sites"
+
+
+def test_query_pushes_columns_condition_and_limit():
+    reader = PostGisTableDataReader(
+        None,
+        schema="public",
+        table_name="Sites",
+        geometry_column_name="geom",
+        columns=["id", "name"],
+        where="id > 10",
+        limit=5,
+    )
+    assert " ".join(_compile(reader).split()) == "SELECT id, name, geom FROM public.Sites WHERE id > 10 LIMIT 5"
+
+
+def test_query_keeps_identifiers_unquoted():
+    reader = PostGisTableDataReader(None, schema="Public", table_name="Roads")
+    assert " ".join(_compile(reader).split()) == "SELECT * FROM Public.Roads"
+    reader = PostGisTableDataReader(None, schema="public", table_name='"Roads"', columns=['"Name"'])
+    assert " ".join(_compile(reader).split()) == 'SELECT "Name" FROM public."Roads"'
+
+
+def test_unsupported_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported backend"):
+        PostGisTableDataReader(None, schema="public", table_name="sites", backend="odbc")